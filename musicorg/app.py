@@ -2,18 +2,49 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from pathlib import Path
 import sys
+from typing import TYPE_CHECKING, Iterable
 
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
-from musicorg.config.settings import AppSettings
 from musicorg.runtime_paths import asset_path, builtin_themes_root, is_frozen, package_root
-from musicorg.ui.main_window import MainWindow
-from musicorg.ui.themes.registry import ThemeRegistry
-from musicorg.ui.themes.service import ThemeService
+
+if TYPE_CHECKING:
+    from musicorg.config.settings import AppSettings
+    from musicorg.ui.themes.service import ThemeService
+
+_ICON_THEME_NAME = "musicorg"
+
+
+class _DeferredRotatingFileHandler(logging.Handler):
+    """RotatingFileHandler that creates its directory and file on first emit."""
+
+    def __init__(self, path: Path, **kwargs) -> None:
+        super().__init__()
+        self._path = path
+        self._kwargs = kwargs
+        self._handler: RotatingFileHandler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._handler = RotatingFileHandler(self._path, **self._kwargs)
+            except OSError:
+                self.handleError(record)
+                return
+            self._handler.setFormatter(self.formatter)
+        self._handler.emit(record)
+
+    def close(self) -> None:
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
 
 
 def _configure_startup_logger(settings: AppSettings) -> logging.Logger:
@@ -22,54 +53,99 @@ def _configure_startup_logger(settings: AppSettings) -> logging.Logger:
         return logger
 
     logger.setLevel(logging.INFO)
-    log_dir = settings.app_data_dir / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    handler = RotatingFileHandler(
-        log_dir / "startup.log",
+    file_handler = _DeferredRotatingFileHandler(
+        settings.app_data_dir / "logs" / "startup.log",
         maxBytes=512_000,
         backupCount=3,
         encoding="utf-8",
     )
-    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    # Informational records are buffered and written at shutdown; warnings
+    # flush immediately so problems are still on disk if the app crashes.
+    handler = MemoryHandler(capacity=100, flushLevel=logging.WARNING, target=file_handler)
     logger.addHandler(handler)
     logger.propagate = False
     return logger
 
 
-def run_app() -> int:
-    """Initialize and run the application."""
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    app.setApplicationName("MusicOrg")
-    app.setOrganizationName("MusicOrg")
-    settings = AppSettings()
-    logger = _configure_startup_logger(settings)
-    logger.info("startup mode frozen=%s package_root=%s", is_frozen(), package_root())
+def _first_existing(paths: Iterable[Path]) -> Path | None:
+    for path in paths:
+        try:
+            path.stat()
+        except OSError:
+            continue
+        return path
+    return None
+
+
+@lru_cache(maxsize=1)
+def _app_icon() -> QIcon | None:
+    """Resolve and decode the application icon once per process."""
+    if QIcon.hasThemeIcon(_ICON_THEME_NAME):
+        # An installed desktop icon is already indexed by the platform theme,
+        # so the bundled asset does not need to be probed or read at all.
+        return QIcon.fromTheme(_ICON_THEME_NAME)
+    icon_path = _first_existing((asset_path("musicorg.ico"), asset_path("musicorg.png")))
+    if icon_path is None:
+        return None
+    return QIcon(str(icon_path))
 
-    icon_ico = asset_path("musicorg.ico")
-    icon_png = asset_path("musicorg.png")
-    icon_path = icon_ico if icon_ico.exists() else icon_png
-    if not icon_path.exists():
-        logger.warning("window icon not found: %s or %s", icon_ico, icon_png)
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
+
+def _init_theme(app: QApplication, settings: AppSettings, logger: logging.Logger) -> ThemeService:
+    """Load theme packages and apply the persisted theme.
+
+    Runs on the GUI thread before the main window is shown: the registry is
+    not thread-safe, and the first paint should already use the theme. The
+    registry's parse cache keeps this to a few stat calls per theme.
+    """
+    from musicorg.ui.themes.registry import ThemeRegistry
+    from musicorg.ui.themes.service import ThemeService
 
     builtin_themes = builtin_themes_root()
     if not builtin_themes.exists():
         logger.warning("builtin theme root missing at %s", builtin_themes)
 
-    theme_registry = ThemeRegistry(builtin_root=builtin_themes, user_root=settings.themes_dir)
+    theme_registry = ThemeRegistry(
+        builtin_root=builtin_themes,
+        user_root=settings.themes_dir,
+        cache_path=settings.app_data_dir / "theme_cache.json",
+    )
     theme_service = ThemeService(app, settings, theme_registry)
-    theme_service.reload_themes()
-    errors = theme_registry.load_errors()
+    errors = theme_service.reload_themes()
     if errors:
         logger.warning("theme load warnings: %s", " | ".join(errors[:6]))
     theme_service.apply_startup_theme()
+    return theme_service
+
+
+def run_app() -> int:
+    """Initialize and run the application."""
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    app.setApplicationName("MusicOrg")
+    app.setOrganizationName("MusicOrg")
+
+    # Heavy UI modules are imported only once the QApplication exists so the
+    # interpreter does not pay for every panel before Qt is even initialised.
+    from musicorg.config.settings import AppSettings
+    from musicorg.ui.main_window import MainWindow
+
+    settings = AppSettings.instance()
+    logger = _configure_startup_logger(settings)
+    logger.info("startup mode frozen=%s package_root=%s", is_frozen(), package_root())
+
+    icon = _app_icon()
+    if icon is None:
+        logger.warning("window icon not found in %s", asset_path())
+    else:
+        app.setWindowIcon(icon)
+
+    theme_service = _init_theme(app, settings, logger)
 
     # Create and show main window
     window = MainWindow(settings, theme_service=theme_service)
-    if icon_path.exists():
-        window.setWindowIcon(QIcon(str(icon_path)))
+    if icon is not None:
+        window.setWindowIcon(icon)
     window.show()
 
     exit_code = app.exec()
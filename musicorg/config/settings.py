@@ -2,172 +2,197 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+import os
 from pathlib import Path
-from typing import Mapping
+from typing import Callable, Mapping
 
 from PySide6.QtCore import QSettings
 
+_APP_DATA_ROOT = Path(os.environ.get("APPDATA") or (Path.home() / ".config")) / "musicorg"
+_DEFAULT_THEME_ID = "musicorg-default"
+_ARTWORK_SELECTION_MODES = frozenset({"none", "single_click", "double_click"})
+
 
 class AppSettings:
     """Wraps QSettings for persistent app configuration."""
 
+    _instance: AppSettings | None = None
+
     def __init__(self) -> None:
         self._qs = QSettings("MusicOrg", "MusicOrg")
+        self._ensured_dirs: set[Path] = set()
+        # One pass over the backend up front; getters coerce from this snapshot.
+        self._raw: dict[str, object] = {key: self._qs.value(key) for key in self._qs.allKeys()}
+        self._cache: dict[str, object] = {}
+
+    @classmethod
+    def instance(cls) -> AppSettings:
+        """Return the process-wide settings object, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
     # -- directories --
 
     @property
     def source_dir(self) -> str:
-        return self._qs.value("dirs/source", "", type=str)
+        return self._value("dirs/source", "", str)
 
     @source_dir.setter
     def source_dir(self, value: str) -> None:
-        self._qs.setValue("dirs/source", value)
+        self._set_value("dirs/source", value)
 
     @property
     def dest_dir(self) -> str:
-        return self._qs.value("dirs/dest", "", type=str)
+        return self._value("dirs/dest", "", str)
 
     @dest_dir.setter
     def dest_dir(self, value: str) -> None:
-        self._qs.setValue("dirs/dest", value)
+        self._set_value("dirs/dest", value)
 
     # -- discogs --
 
     @property
     def discogs_token(self) -> str:
-        return self._qs.value("discogs/token", "", type=str)
+        return self._value("discogs/token", "", str)
 
     @discogs_token.setter
     def discogs_token(self, value: str) -> None:
-        self._qs.setValue("discogs/token", value)
+        self._set_value("discogs/token", value)
 
     # -- path format --
 
     @property
     def path_format(self) -> str:
         default = "$albumartist/$album/$track $title"
-        return self._qs.value("sync/path_format", default, type=str)
+        return self._value("sync/path_format", default, str)
 
     @path_format.setter
     def path_format(self, value: str) -> None:
-        self._qs.setValue("sync/path_format", value)
+        self._set_value("sync/path_format", value)
 
     # -- tag cache --
 
-    @property
+    @cached_property
     def tag_cache_db_path(self) -> str:
-        return str(self.app_data_dir / "tag_cache.db")
+        return os.fspath(self.app_data_dir / "tag_cache.db")
 
     # -- backdrop opacity --
 
     @property
     def backdrop_opacity(self) -> float:
-        return self._qs.value("ui/backdrop_opacity", 0.07, type=float)
+        return self._value("ui/backdrop_opacity", 0.07, float)
 
     @backdrop_opacity.setter
     def backdrop_opacity(self, value: float) -> None:
-        self._qs.setValue("ui/backdrop_opacity", value)
+        self._set_value("ui/backdrop_opacity", value)
 
     # -- theme --
 
     @property
     def theme_id(self) -> str:
-        raw = self._qs.value("ui/theme_id", "musicorg-default", type=str)
-        value = (raw or "").strip()
-        return value or "musicorg-default"
+        return self._value("ui/theme_id", _DEFAULT_THEME_ID, str, _clean_theme_id)
 
     @theme_id.setter
     def theme_id(self, value: str) -> None:
-        cleaned = (value or "").strip() or "musicorg-default"
-        self._qs.setValue("ui/theme_id", cleaned)
+        self._set_value("ui/theme_id", _clean_theme_id(value))
 
     @property
     def theme_last_known_good_id(self) -> str:
-        raw = self._qs.value("ui/theme_last_known_good_id", "musicorg-default", type=str)
-        value = (raw or "").strip()
-        return value or "musicorg-default"
+        return self._value("ui/theme_last_known_good_id", _DEFAULT_THEME_ID, str, _clean_theme_id)
 
     @theme_last_known_good_id.setter
     def theme_last_known_good_id(self, value: str) -> None:
-        cleaned = (value or "").strip() or "musicorg-default"
-        self._qs.setValue("ui/theme_last_known_good_id", cleaned)
+        self._set_value("ui/theme_last_known_good_id", _clean_theme_id(value))
 
     @property
     def theme_custom_dir(self) -> str:
-        raw = self._qs.value("ui/theme_custom_dir", "", type=str)
-        return (raw or "").strip()
+        return self._value("ui/theme_custom_dir", "", str, _clean_str)
 
     @theme_custom_dir.setter
     def theme_custom_dir(self, value: str) -> None:
-        cleaned = (value or "").strip()
-        self._qs.setValue("ui/theme_custom_dir", cleaned)
+        self._set_value("ui/theme_custom_dir", _clean_str(value))
 
     # -- album artwork selection mode --
 
     @property
     def album_artwork_selection_mode(self) -> str:
-        raw = self._qs.value("ui/album_artwork_selection_mode", "single_click", type=str)
-        mode = (raw or "").strip().lower()
-        if mode in {"none", "single_click", "double_click"}:
-            return mode
-        return "single_click"
+        return self._value(
+            "ui/album_artwork_selection_mode", "single_click", str, _clean_artwork_selection_mode
+        )
 
     @album_artwork_selection_mode.setter
     def album_artwork_selection_mode(self, value: str) -> None:
-        mode = (value or "").strip().lower()
-        if mode not in {"none", "single_click", "double_click"}:
-            mode = "single_click"
-        self._qs.setValue("ui/album_artwork_selection_mode", mode)
+        self._set_value("ui/album_artwork_selection_mode", _clean_artwork_selection_mode(value))
 
     # -- keybind overrides --
 
     @property
     def keybind_overrides(self) -> dict[str, str]:
-        raw = self._qs.value("ui/keybind_overrides", {})
-        if raw is None:
+        raw = self._value("ui/keybind_overrides", {})
+        if not isinstance(raw, Mapping):
             return {}
-        if isinstance(raw, Mapping):
-            source_items = raw.items()
-        else:
-            return {}
-        cleaned: dict[str, str] = {}
-        for key, value in source_items:
-            if isinstance(key, str) and isinstance(value, str):
-                cleaned[key] = value
-        return cleaned
+        return _clean_keybind_overrides(raw)
 
     @keybind_overrides.setter
     def keybind_overrides(self, value: dict[str, str]) -> None:
-        cleaned: dict[str, str] = {}
-        for key, item in value.items():
-            if isinstance(key, str) and isinstance(item, str):
-                cleaned[key] = item
-        self._qs.setValue("ui/keybind_overrides", cleaned)
+        self._set_value("ui/keybind_overrides", _clean_keybind_overrides(value))
 
     # -- window geometry --
 
     @property
     def window_geometry(self) -> bytes | None:
-        return self._qs.value("ui/window_geometry")
+        return self._value("ui/window_geometry")
 
     @window_geometry.setter
     def window_geometry(self, value: bytes) -> None:
-        self._qs.setValue("ui/window_geometry", value)
+        self._set_value("ui/window_geometry", value)
 
     # -- helpers --
 
+    def _value(
+        self,
+        key: str,
+        default: object = None,
+        value_type: type | None = None,
+        normalize: Callable[[object], object] | None = None,
+    ):
+        """Return a setting from the startup snapshot, coercing it once.
+
+        *normalize* runs on the coerced value and its result is what gets
+        cached, so validating getters do their cleanup once per write.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key in self._raw:
+            value = _coerce(self._raw[key], default, value_type)
+        else:
+            value = default
+        if normalize is not None:
+            value = normalize(value)
+        self._cache[key] = value
+        return value
+
+    def _set_value(self, key: str, value: object) -> None:
+        current = self._raw.get(key)
+        if type(current) is type(value) and current == value:
+            # Unchanged writes would still mark QSettings dirty and rewrite
+            # the backing store on the next sync.
+            return
+        self._qs.setValue(key, value)
+        self._raw[key] = value
+        self._cache.pop(key, None)
+
     @property
     def app_data_dir(self) -> Path:
-        path = self._app_data_dir()
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._ensure_dir(self._app_data_dir())
 
     @property
     def default_themes_dir(self) -> Path:
-        path = self.app_data_dir / "themes"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._ensure_dir(self.app_data_dir / "themes")
 
     @property
     def themes_dir(self) -> Path:
@@ -175,14 +200,49 @@ class AppSettings:
         if not custom:
             return self.default_themes_dir
         try:
-            path = Path(custom).expanduser()
-            path.mkdir(parents=True, exist_ok=True)
-            return path
+            return self._ensure_dir(Path(custom).expanduser())
         except OSError:
             return self.default_themes_dir
 
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create *path* on first use; later lookups skip the mkdir syscall."""
+        if path not in self._ensured_dirs:
+            try:
+                path.stat()
+            except FileNotFoundError:
+                path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+        return path
+
     @staticmethod
     def _app_data_dir() -> Path:
-        import os
-        base = Path(os.environ.get("APPDATA", Path.home() / ".config"))
-        return base / "musicorg"
+        return _APP_DATA_ROOT
+
+
+def _clean_str(raw: object) -> str:
+    return (raw or "").strip()
+
+
+def _clean_theme_id(raw: object) -> str:
+    return _clean_str(raw) or _DEFAULT_THEME_ID
+
+
+def _clean_artwork_selection_mode(raw: object) -> str:
+    mode = _clean_str(raw).lower()
+    return mode if mode in _ARTWORK_SELECTION_MODES else "single_click"
+
+
+def _clean_keybind_overrides(raw: Mapping[object, object]) -> dict[str, str]:
+    # Exact type checks: QSettings only ever hands back plain str keys/values.
+    return {key: value for key, value in raw.items() if type(key) is str and type(value) is str}
+
+
+def _coerce(raw: object, default: object, value_type: type | None) -> object:
+    if value_type is None or isinstance(raw, value_type):
+        return raw
+    if raw is None:
+        return default
+    try:
+        return value_type(raw)
+    except (TypeError, ValueError):
+        return default
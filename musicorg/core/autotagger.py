@@ -2,27 +2,328 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import copy
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache, wraps
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+import os
 from pathlib import Path
+import random
 import re
+import sys
+from threading import Lock
 import time
-from typing import Any, Callable, ParamSpec, TypeVar, TypedDict
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple, ParamSpec, TypeVar, TypedDict
 
 from musicorg import __version__
 from musicorg.core.tagger import TagData, TagManager
 
+try:
+    from rapidfuzz import fuzz as _rapidfuzz_fuzz, process as _rapidfuzz_process
+except ImportError:  # optional: pip install musicorg[extras]
+    _rapidfuzz_fuzz = None
+    _rapidfuzz_process = None
+
+if TYPE_CHECKING:
+    import requests
+
 
 _UUID_RE = re.compile(
     r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
 )
+_YEAR_RE = re.compile(r"^(\d{4})")
+_DISC_TRACK_RE = re.compile(r"^(\d+)-(\d+)$")
+_LETTER_TRACK_RE = re.compile(r"^([A-Z])(\d+)$")
+_INT_ANY_RE = re.compile(r"(\d+)")
+# Leading "03 " or "1-03 " in a file name: the zero-padded "$disc-$track $title"
+# layout the syncer writes. Looser shapes ("1979", "2-4-6-8 ...") are titles.
+_FILENAME_POSITION_RE = re.compile(r"^(?:([1-9]\d?)-)?(\d{2,3}) (?=\S)")
+
+_ARTWORK_REQUEST_HEADERS = {
+    "User-Agent": f"MusicOrg/{__version__}",
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+    "Referer": "https://musicbrainz.org/",
+}
+_IMAGE_SIGNATURES = (
+    (b"\xFF\xD8\xFF", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+_TRANSIENT_HTTP_STATUSES = frozenset({429, 502, 503, 504})
+_TRANSIENT_ERROR_MARKERS = (
+    "timed out",
+    "timeout",
+    "forcibly closed",
+    "connection reset",
+    "remote end closed",
+    "temporarily unavailable",
+    "try again",
+    "service unavailable",
+    "winerror 10054",
+    "http error 429",
+    "http error 502",
+    "http error 503",
+    "http error 504",
+)
+# One scan for every marker; \s+ between words tolerates wrapped messages.
+_TRANSIENT_ERROR_RE = re.compile(
+    "|".join(r"\s+".join(map(re.escape, marker.split())) for marker in _TRANSIENT_ERROR_MARKERS),
+    re.IGNORECASE,
+)
+_ARTWORK_FETCH_WORKERS = 4
+_ARTWORK_HEDGE_DELAY = 1.5
+_ARTWORK_TIMEOUT = (3.05, 12)  # (connect, read) seconds
+_ARTWORK_CHUNK_SIZE = 64 * 1024
+_HTML_SNIFF_BYTES = 256
+MAX_ARTWORK_BYTES = 8 * 1024 * 1024
+_TAG_WRITE_WORKERS = 4
+_RETRY_BACKOFF_BASE = 0.35
+_RETRY_BACKOFF_MAX = 2.0
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
-class TrackMetadata(TypedDict):
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Shared keep-alive session so repeated artwork fetches reuse connections."""
+    # requests and urllib3 take tens of milliseconds to import, so they are
+    # loaded on the first artwork fetch rather than when the UI imports us.
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+
+    session = requests.Session()
+    # Transient statuses and dropped connections are retried inside urllib3.
+    # Retry-After is ignored so a throttled host cannot stall a fetch for
+    # minutes; the hedged download moves on to other candidates instead.
+    retry = Retry(
+        total=2,
+        backoff_factor=0.25,
+        status_forcelist=_TRANSIENT_HTTP_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    With *weigh*, least recently used entries are also evicted while the
+    summed weight of all entries exceeds *max_weight*.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        *,
+        weigh: Callable[[Any], int] | None = None,
+        max_weight: int = 0,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._weigh = weigh
+        self._max_weight = max_weight
+        self._weight = 0
+        self._entries: OrderedDict[Any, tuple[float, Any, int]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        ttl = self._ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        weight = self._weigh(value) if self._weigh is not None else 0
+        if self._weigh is not None and weight > self._max_weight:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (time.monotonic() + ttl, value, weight)
+            self._weight += weight
+            while len(self._entries) > self._maxsize or (
+                self._weigh is not None and self._weight > self._max_weight
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    def _pop(self, key: Any) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._weight -= entry[2]
+
+
+_SEARCH_CACHE_TTL = 300.0
+_ARTWORK_CACHE_TTL = 300.0
+_RELEASE_CACHE_TTL = 3600.0
+_search_caches: list[_TTLCache] = []
+# Full MusicBrainz releases keyed by MBID; different searches often surface the
+# same releases, and each lookup costs a rate-limited request.
+_mb_release_cache = _TTLCache(maxsize=256, ttl=_RELEASE_CACHE_TTL)
+# Covers are shared between releases of a release group and re-requested by
+# previews and applies, so recent ones are kept within a byte budget.
+_ARTWORK_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_artwork_cache = _TTLCache(
+    maxsize=64,
+    ttl=_ARTWORK_CACHE_TTL,
+    weigh=lambda artwork: len(artwork[0]),
+    max_weight=_ARTWORK_CACHE_MAX_BYTES,
+)
+# Text tags keyed on (path, mtime_ns, size), so an apply right after a search
+# reuses what the search read and any rewrite of the file misses naturally.
+_tag_read_cache = _TTLCache(maxsize=256, ttl=_SEARCH_CACHE_TTL)
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+def _memoize_search(
+    method: Callable[[AutoTagger, str, str], list[MatchCandidate]],
+) -> Callable[[AutoTagger, str, str], list[MatchCandidate]]:
+    """Share provider search results across AutoTagger instances (TTL + LRU).
+
+    Workers build a fresh AutoTagger per run, so the cache lives at module
+    scope and is keyed on the Discogs token plus the two query strings.
+    Failed searches raise and are never cached. Candidates hold mutable
+    track lists and payload dicts, so every caller gets its own deep copy.
+    """
+    cache = _TTLCache(maxsize=512, ttl=_SEARCH_CACHE_TTL)
+    _search_caches.append(cache)
+
+    @wraps(method)
+    def wrapper(self: AutoTagger, artist: str, query: str) -> list[MatchCandidate]:
+        key = (self._discogs_token, artist, query)
+        cached = cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(list(cached))
+        results = method(self, artist, query)
+        cache.set(key, copy.deepcopy(tuple(results)))
+        return results
+
+    return wrapper
+
+
+def _read_tags_cached(reader: TagManager, path: str | Path) -> TagData:
+    """Read *path* through the shared tag cache; artwork is not kept."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return reader.read(path)
+    key = (os.fspath(path), stat.st_mtime_ns, stat.st_size)
+    tags = _tag_read_cache.get(key)
+    if tags is None:
+        tags = reader.read(path, include_artwork=False)
+        _tag_read_cache.set(key, tags)
+    return tags
+
+
+def _filename_position(path: Path) -> tuple[int, int] | None:
+    """(disc, track) from a syncer-style "1-03 Title" / "03 Title" file name."""
+    match = _FILENAME_POSITION_RE.match(path.stem)
+    if match is None:
+        return None
+    return int(match.group(1) or 1), int(match.group(2))
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with equal jitter for the *attempt*-th retry (0-based).
+
+    Half the delay is fixed so a retry never fires immediately; the random
+    half keeps workers that failed together from retrying in lockstep.
+    """
+    delay = min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF_BASE * (2**attempt))
+    return delay / 2 + random.uniform(0.0, delay / 2)
+
+
+def _cache_ttl_from_headers(headers: Any, default: float) -> float:
+    """Return how long a response may be reused according to Cache-Control."""
+    cache_control = str(headers.get("Cache-Control", "") or "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return min(float(match.group(1)), default)
+    return default
+
+
+def _similarity(a: str, b: str) -> float:
+    """Return a 0..1 similarity ratio, using RapidFuzz when it is installed."""
+    if a == b:
+        return 1.0
+    if _rapidfuzz_fuzz is not None:
+        return _rapidfuzz_fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _best_similarity(query: str, choices: list[str], score_cutoff: float = 0.0) -> tuple[int, float]:
+    """Return (index, ratio) of the best choice scoring at least *score_cutoff*.
+
+    *query* and *choices* are compared as-is; lowercase them beforehand.
+    Returns (-1, 0.0) when no choice reaches the cutoff.
+    """
+    if not choices:
+        return -1, 0.0
+    try:
+        return choices.index(query), 1.0
+    except ValueError:
+        pass
+    if _rapidfuzz_process is not None:
+        # One native call scores every choice instead of re-entering Python per
+        # pair; the cutoff lets RapidFuzz abandon hopeless pairs early. Callers
+        # normalise case up front, so no per-comparison processor is run.
+        best = _rapidfuzz_process.extractOne(
+            query,
+            choices,
+            scorer=_rapidfuzz_fuzz.ratio,
+            processor=None,
+            score_cutoff=score_cutoff * 100.0,
+        )
+        if best is None:
+            return -1, 0.0
+        _, score, index = best
+        return index, score / 100.0
+    query_len = len(query)
+    best_index = -1
+    best_ratio = 0.0
+    for index, choice in enumerate(choices):
+        # Both ratios are bounded by 2*min(len)/(len_a + len_b), so pairs whose
+        # lengths alone rule out the cutoff never reach the O(n*m) matcher.
+        total_len = query_len + len(choice)
+        if total_len and 2.0 * min(query_len, len(choice)) / total_len < max(score_cutoff, best_ratio):
+            continue
+        ratio = _similarity(query, choice)
+        if ratio > best_ratio and ratio >= score_cutoff:
+            best_index = index
+            best_ratio = ratio
+    return best_index, best_ratio
+
+
+class TrackRow(NamedTuple):
+    """One track of a candidate release."""
+
     track: int
     disc: int
     title: str
@@ -37,7 +338,7 @@ class MatchPayload(TypedDict, total=False):
     year: int
     release_id: str
     release_group_id: str
-    tracks: list[TrackMetadata]
+    tracks: list[TrackRow]
     artwork_urls: list[str]
     genre: str
     track: int
@@ -52,7 +353,7 @@ class SearchDiagnostics(TypedDict):
     source_counts: dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchCandidate:
     """A single match candidate from MusicBrainz or Discogs."""
 
@@ -61,7 +362,7 @@ class MatchCandidate:
     album: str = ""
     year: int = 0
     distance: float = 1.0  # 0.0 = perfect, 1.0 = worst
-    tracks: list[TrackMetadata] = field(default_factory=list)
+    tracks: list[TrackRow] = field(default_factory=list)
     raw_match: MatchPayload | None = None
 
     @property
@@ -76,6 +377,7 @@ class AutoTagger:
 
     def __init__(self, discogs_token: str = "") -> None:
         self._discogs_token = discogs_token.strip()
+        self._tag_manager = TagManager()
         if not AutoTagger._mb_useragent_set:
             try:
                 import musicbrainzngs
@@ -119,32 +421,12 @@ class AutoTagger:
         if not artist and not album:
             return self._build_search_payload([], {})
 
-        results: list[MatchCandidate] = []
-        source_errors: dict[str, str] = {}
-        attempted_sources: list[str] = []
-
-        attempted_sources.append("MusicBrainz")
-        try:
-            results.extend(self._call_with_retry(self._search_album_mb, artist, album))
-        except Exception as exc:
-            source_errors["MusicBrainz"] = str(exc)
-
+        searches: list[tuple[str, Callable[[str, str], list[MatchCandidate]]]] = [
+            ("MusicBrainz", self._search_album_mb),
+        ]
         if self._discogs_token:
-            attempted_sources.append("Discogs")
-            try:
-                results.extend(self._call_with_retry(self._search_album_discogs, artist, album))
-            except Exception as exc:
-                source_errors["Discogs"] = str(exc)
-
-        results.sort(key=lambda m: m.distance)
-        if not results and attempted_sources and len(source_errors) == len(attempted_sources):
-            detail = "; ".join(
-                f"{source}: {source_errors[source]}"
-                for source in attempted_sources
-                if source in source_errors
-            )
-            raise RuntimeError(detail)
-        return self._build_search_payload(results, source_errors)
+            searches.append(("Discogs", self._search_album_discogs))
+        return self._search_sources(searches, artist, album)
 
     def search_item(
         self,
@@ -174,9 +456,8 @@ class AutoTagger:
         artist = artist_hint.strip()
         title = title_hint.strip()
         if not artist or not title:
-            tm = TagManager()
             try:
-                tags = tm.read(path)
+                tags = _read_tags_cached(self._tag_manager, path)
                 if not artist:
                     artist = (tags.artist or tags.albumartist or "").strip()
                 if not title:
@@ -186,32 +467,12 @@ class AutoTagger:
         if not artist and not title:
             return self._build_search_payload([], {})
 
-        results: list[MatchCandidate] = []
-        source_errors: dict[str, str] = {}
-        attempted_sources: list[str] = []
-
-        attempted_sources.append("MusicBrainz")
-        try:
-            results.extend(self._call_with_retry(self._search_item_mb, artist, title))
-        except Exception as exc:
-            source_errors["MusicBrainz"] = str(exc)
-
+        searches: list[tuple[str, Callable[[str, str], list[MatchCandidate]]]] = [
+            ("MusicBrainz", self._search_item_mb),
+        ]
         if self._discogs_token:
-            attempted_sources.append("Discogs")
-            try:
-                results.extend(self._call_with_retry(self._search_item_discogs, artist, title))
-            except Exception as exc:
-                source_errors["Discogs"] = str(exc)
-
-        results.sort(key=lambda m: m.distance)
-        if not results and attempted_sources and len(source_errors) == len(attempted_sources):
-            detail = "; ".join(
-                f"{source}: {source_errors[source]}"
-                for source in attempted_sources
-                if source in source_errors
-            )
-            raise RuntimeError(detail)
-        return self._build_search_payload(results, source_errors)
+            searches.append(("Discogs", self._search_item_discogs))
+        return self._search_sources(searches, artist, title)
 
     def apply_match(self, paths: list[str | Path], match: MatchCandidate) -> bool:
         """Apply a selected dict-based match candidate to one or more files."""
@@ -220,14 +481,18 @@ class AutoTagger:
         match_payload = getattr(match, "raw_match", None)
         if not isinstance(match_payload, dict):
             return False
+        tracks = match_payload.get("tracks")
+        if isinstance(tracks, list) and not tracks:
+            # An album match without tracks writes nothing; skip the download.
+            return False
 
         try:
             artwork = self._download_artwork_from_urls(match_payload.get("artwork_urls", []))
             artwork_data = artwork[0] if artwork else None
             artwork_mime = artwork[1] if artwork else ""
 
-            tag_writer = TagManager()
-            if isinstance(match_payload.get("tracks"), list):
+            tag_writer = self._tag_manager
+            if isinstance(tracks, list):
                 return self._apply_album_match(
                     tag_writer=tag_writer,
                     paths=paths,
@@ -245,6 +510,48 @@ class AutoTagger:
         except Exception as exc:
             raise RuntimeError(f"Apply match failed: {exc}") from exc
 
+    @classmethod
+    def clear_search_cache(cls) -> None:
+        """Forget memoized searches, release details, tag reads and artwork."""
+        for cache in _search_caches:
+            cache.clear()
+        _mb_release_cache.clear()
+        _tag_read_cache.clear()
+        _artwork_cache.clear()
+
+    def _search_sources(
+        self,
+        searches: list[tuple[str, Callable[[str, str], list[MatchCandidate]]]],
+        artist: str,
+        query: str,
+    ) -> SearchDiagnostics:
+        """Run provider searches concurrently and merge them in source order."""
+        attempted_sources = [source for source, _ in searches]
+        results: list[MatchCandidate] = []
+        source_errors: dict[str, str] = {}
+        # Providers are independent and network-bound, so total latency is the
+        # slowest source rather than the sum of all of them.
+        with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+            futures = [
+                (source, executor.submit(self._call_with_retry, operation, artist, query))
+                for source, operation in searches
+            ]
+            for source, future in futures:
+                try:
+                    results.extend(future.result())
+                except Exception as exc:
+                    source_errors[source] = str(exc)
+
+        results.sort(key=attrgetter("distance"))
+        if not results and attempted_sources and len(source_errors) == len(attempted_sources):
+            detail = "; ".join(
+                f"{source}: {source_errors[source]}"
+                for source in attempted_sources
+                if source in source_errors
+            )
+            raise RuntimeError(detail)
+        return self._build_search_payload(results, source_errors)
+
     def _resolve_hints_from_files(
         self,
         paths: list[str | Path],
@@ -256,10 +563,9 @@ class AutoTagger:
         if artist and album:
             return artist, album
 
-        tm = TagManager()
         for raw_path in paths:
             try:
-                tags = tm.read(raw_path)
+                tags = _read_tags_cached(self._tag_manager, raw_path)
             except Exception:
                 continue
             if not artist:
@@ -270,6 +576,7 @@ class AutoTagger:
                 break
         return artist, album
 
+    @_memoize_search
     def _search_album_mb(self, artist: str, album: str) -> list[MatchCandidate]:
         import musicbrainzngs
 
@@ -280,25 +587,22 @@ class AutoTagger:
             query["release"] = album
         data = musicbrainzngs.search_releases(**query)
 
+        releases = data.get("release-list", [])[:5]
+
         candidates: list[MatchCandidate] = []
-        for release in data.get("release-list", [])[:5]:
+        for release in releases:
             release_id = release.get("id", "")
-            full_release = release
-            if self._is_uuid(release_id):
-                try:
-                    details = musicbrainzngs.get_release_by_id(
-                        release_id,
-                        includes=["recordings", "artist-credits"],
-                    )
-                    full_release = details.get("release", release)
-                except Exception:
-                    pass
+            # musicbrainzngs serializes every request behind its rate limiter,
+            # so lookups run in turn; repeat releases come from the cache.
+            full_release = self._mb_release_details(release_id)
+            if full_release is None:
+                full_release = release
 
             release_group = full_release.get("release-group") or release.get("release-group") or {}
             release_group_id = release_group.get("id", "")
             track_rows = self._mb_album_tracks(full_release)
-            artist_name = self._mb_artist_credit(full_release) or self._mb_artist_credit(release)
-            title = str(full_release.get("title", "") or release.get("title", ""))
+            artist_name = sys.intern(self._mb_artist_credit(full_release) or self._mb_artist_credit(release))
+            title = sys.intern(str(full_release.get("title", "") or release.get("title", "")))
             year = self._mb_extract_year(full_release) or self._mb_extract_year(release)
             score = float(release.get("ext:score", 0) or 0.0)
             distance = 1.0 - max(0.0, min(score, 100.0)) / 100.0
@@ -327,32 +631,55 @@ class AutoTagger:
             )
         return candidates
 
-    def _mb_album_tracks(self, release: dict[str, Any]) -> list[TrackMetadata]:
-        tracks: list[TrackMetadata] = []
+    def _mb_release_details(self, release_id: str) -> dict[str, Any] | None:
+        """Fetch a release with recordings, or None when the lookup is not possible."""
+        if not self._is_uuid(release_id):
+            return None
+        cached = _mb_release_cache.get(release_id)
+        if cached is not None:
+            return cached
+        import musicbrainzngs
+
+        try:
+            details = musicbrainzngs.get_release_by_id(
+                release_id,
+                includes=["recordings", "artist-credits"],
+            )
+        except Exception:
+            return None
+        release = details.get("release")
+        if release is not None:
+            _mb_release_cache.set(release_id, release)
+        return release
+
+    def _mb_album_tracks(self, release: dict[str, Any]) -> list[TrackRow]:
+        tracks: list[TrackRow] = []
         medium_list = release.get("medium-list", [])
         for medium_index, medium in enumerate(medium_list, start=1):
             disc_num = self._coerce_int(medium.get("position", medium_index), medium_index)
             for track_index, track in enumerate(medium.get("track-list", []), start=1):
                 recording = track.get("recording", {})
                 title = str(recording.get("title", "") or track.get("title", ""))
-                track_artist = self._mb_artist_credit(recording) or self._mb_artist_credit(track)
+                # The same credit repeats on most tracks; share one string.
+                track_artist = sys.intern(self._mb_artist_credit(recording) or self._mb_artist_credit(track))
                 length_ms = recording.get("length", track.get("length", 0))
-                length_secs = int(length_ms) // 1000 if str(length_ms).isdigit() else 0
+                length_secs = self._length_ms_to_secs(length_ms)
                 track_num = self._coerce_int(
                     track.get("number", track.get("position", track_index)),
                     track_index,
                 )
                 tracks.append(
-                    {
-                        "track": track_num,
-                        "disc": disc_num,
-                        "title": title,
-                        "artist": track_artist,
-                        "length": length_secs,
-                    }
+                    TrackRow(
+                        track=track_num,
+                        disc=disc_num,
+                        title=title,
+                        artist=track_artist,
+                        length=length_secs,
+                    )
                 )
         return tracks
 
+    @_memoize_search
     def _search_album_discogs(self, artist: str, album: str) -> list[MatchCandidate]:
         import discogs_client
 
@@ -368,20 +695,18 @@ class AutoTagger:
             client._session.timeout = 10  # type: ignore[attr-defined]
         releases = client.search(**query)
 
+        query_artist = artist.strip().lower()
+        query_album = album.strip().lower()
         candidates: list[MatchCandidate] = []
         for release in self._limit_results(releases, 5):
-            release_artist = self._discogs_artist_name(release)
-            release_album = str(getattr(release, "title", "") or "")
+            release_artist = sys.intern(self._discogs_artist_name(release))
+            release_album = sys.intern(str(getattr(release, "title", "") or ""))
             release_year = self._coerce_int(getattr(release, "year", 0), 0)
             release_id = str(getattr(release, "id", "") or "")
             track_rows = self._discogs_tracks(release)
             artwork_urls = self._discogs_artwork_urls(release)
-            genre = ", ".join(
-                part
-                for part in [*list(getattr(release, "genres", []) or []), *list(getattr(release, "styles", []) or [])]
-                if part
-            )
-            distance = self._discogs_distance(artist, album, release)
+            genre = self._discogs_genre(release)
+            distance = self._discogs_distance_prepared(query_artist, query_album, release)
 
             raw_match: MatchPayload = {
                 "source": "Discogs",
@@ -407,9 +732,10 @@ class AutoTagger:
             )
         return candidates
 
-    def _discogs_tracks(self, release: Any) -> list[TrackMetadata]:
-        track_rows: list[TrackMetadata] = []
-        tracklist = list(getattr(release, "tracklist", []) or [])
+    def _discogs_tracks(self, release: Any) -> list[TrackRow]:
+        track_rows: list[TrackRow] = []
+        tracklist = getattr(release, "tracklist", None) or ()
+        release_artist = sys.intern(self._discogs_artist_name(release))
         for index, track in enumerate(tracklist, start=1):
             disc_num, track_num = self._parse_discogs_position(
                 str(getattr(track, "position", "") or ""),
@@ -418,16 +744,17 @@ class AutoTagger:
             if track_num <= 0:
                 track_num = index
             track_rows.append(
-                {
-                    "track": track_num,
-                    "disc": disc_num,
-                    "title": str(getattr(track, "title", "") or ""),
-                    "artist": self._discogs_artist_name(release),
-                    "length": self._parse_duration(str(getattr(track, "duration", "") or "")),
-                }
+                TrackRow(
+                    track=track_num,
+                    disc=disc_num,
+                    title=str(getattr(track, "title", "") or ""),
+                    artist=release_artist,
+                    length=self._parse_duration(str(getattr(track, "duration", "") or "")),
+                )
             )
         return track_rows
 
+    @_memoize_search
     def _search_item_mb(self, artist: str, title: str) -> list[MatchCandidate]:
         import musicbrainzngs
 
@@ -444,14 +771,14 @@ class AutoTagger:
             release_id = release.get("id", "")
             release_group = release.get("release-group") or {}
             release_group_id = release_group.get("id", "")
-            item_artist = self._mb_artist_credit(recording) or artist
+            item_artist = sys.intern(self._mb_artist_credit(recording) or artist)
             item_title = recording.get("title", title)
-            item_album = release.get("title", "")
+            item_album = sys.intern(str(release.get("title", "") or ""))
             item_year = self._mb_extract_year(release)
             score = float(recording.get("ext:score", 0) or 0.0)
             distance = 1.0 - max(0.0, min(score, 100.0)) / 100.0
             length_ms = recording.get("length", 0)
-            length_secs = int(length_ms) // 1000 if str(length_ms).isdigit() else 0
+            length_secs = self._length_ms_to_secs(length_ms)
 
             raw_match: MatchPayload = {
                 "source": "MusicBrainz",
@@ -475,19 +802,20 @@ class AutoTagger:
                     year=item_year,
                     distance=distance,
                     tracks=[
-                        {
-                            "track": 0,
-                            "disc": 0,
-                            "title": item_title,
-                            "artist": item_artist,
-                            "length": length_secs,
-                        }
+                        TrackRow(
+                            track=0,
+                            disc=0,
+                            title=item_title,
+                            artist=item_artist,
+                            length=length_secs,
+                        )
                     ],
                     raw_match=raw_match,
                 )
             )
         return candidates
 
+    @_memoize_search
     def _search_item_discogs(self, artist: str, title: str) -> list[MatchCandidate]:
         import discogs_client
 
@@ -500,36 +828,38 @@ class AutoTagger:
             client._session.timeout = 10  # type: ignore[attr-defined]
         releases = client.search(title, type="release")
 
+        query_artist = artist.strip().lower()
+        query_title = title.lower()
         candidates: list[MatchCandidate] = []
         for release in self._limit_results(releases, 25):
-            best_track = None
-            best_ratio = 0.0
-            for track in list(getattr(release, "tracklist", []) or []):
+            titled_tracks: list[Any] = []
+            track_titles: list[str] = []
+            for track in getattr(release, "tracklist", None) or ():
                 track_title = str(getattr(track, "title", "") or "")
                 if not track_title:
                     continue
-                ratio = SequenceMatcher(None, title.lower(), track_title.lower()).ratio()
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_track = track
-            if best_track is None or best_ratio < 0.6:
+                titled_tracks.append(track)
+                track_titles.append(track_title.lower())
+            best_index, best_ratio = _best_similarity(query_title, track_titles, score_cutoff=0.6)
+            if best_index < 0:
                 continue
+            best_track = titled_tracks[best_index]
 
             disc_num, track_num = self._parse_discogs_position(
                 str(getattr(best_track, "position", "") or ""),
                 default_disc=1,
             )
-            release_artist = self._discogs_artist_name(release)
-            release_album = str(getattr(release, "title", "") or "")
+            release_artist = sys.intern(self._discogs_artist_name(release))
+            release_album = sys.intern(str(getattr(release, "title", "") or ""))
             release_year = self._coerce_int(getattr(release, "year", 0), 0)
             release_id = str(getattr(release, "id", "") or "")
             artwork_urls = self._discogs_artwork_urls(release)
-            genre = ", ".join(
-                part
-                for part in [*list(getattr(release, "genres", []) or []), *list(getattr(release, "styles", []) or [])]
-                if part
+            genre = self._discogs_genre(release)
+            release_distance = self._discogs_distance_prepared(
+                query_artist,
+                release_album.strip().lower(),
+                release,
             )
-            release_distance = self._discogs_distance(artist, release_album, release)
             title_distance = 1.0 - best_ratio
             distance = max(0.0, min(1.0, (release_distance * 0.4) + (title_distance * 0.6)))
             matched_title = str(getattr(best_track, "title", "") or "")
@@ -557,13 +887,13 @@ class AutoTagger:
                     year=release_year,
                     distance=distance,
                     tracks=[
-                        {
-                            "track": track_num,
-                            "disc": disc_num,
-                            "title": matched_title,
-                            "artist": release_artist,
-                            "length": length,
-                        }
+                        TrackRow(
+                            track=track_num,
+                            disc=disc_num,
+                            title=matched_title,
+                            artist=release_artist,
+                            length=length,
+                        )
                     ],
                     raw_match=raw_match,
                 )
@@ -580,49 +910,85 @@ class AutoTagger:
         artwork_data: bytes | None,
         artwork_mime: str,
     ) -> bool:
-        file_rows: list[tuple[int, int, int, Path]] = []
-        for index, path in enumerate(paths):
-            path_obj = Path(path)
-            disc = 1
-            track = index + 1
-            try:
-                tags = tag_writer.read(path_obj)
-                if tags.disc > 0:
-                    disc = tags.disc
-                if tags.track > 0:
-                    track = tags.track
-            except Exception:
-                pass
-            file_rows.append((disc, track, index, path_obj))
-        file_rows.sort(key=lambda row: (row[0], row[1], row[2]))
-
-        tracks = list(match_payload.get("tracks") or [])
-        tracks.sort(key=lambda row: (self._coerce_int(row.get("disc"), 1), self._coerce_int(row.get("track"), 0)))
+        tracks = sorted(match_payload.get("tracks") or [], key=attrgetter("disc", "track"))
         if not tracks:
             return False
 
+        file_rows = None
+        if len(paths) == len(tracks):
+            file_rows = self._file_rows_from_names(
+                paths, {(track_row.disc or 1, track_row.track) for track_row in tracks}
+            )
+        if file_rows is None:
+            # Embedded tags decide the order; a name position only fills in
+            # for files whose tags carry no track number.
+            file_rows = []
+            for index, path in enumerate(paths):
+                path_obj = Path(path)
+                disc = 1
+                track = index + 1
+                try:
+                    tags = _read_tags_cached(tag_writer, path_obj)
+                except Exception:
+                    tags = None
+                if tags is not None and tags.track > 0:
+                    track = tags.track
+                    if tags.disc > 0:
+                        disc = tags.disc
+                else:
+                    position = _filename_position(path_obj)
+                    if position is not None:
+                        disc, track = position
+                    elif tags is not None and tags.disc > 0:
+                        disc = tags.disc
+                file_rows.append((disc, track, index, path_obj))
+        file_rows.sort(key=itemgetter(0, 1, 2))
+
         album_artist = match_payload.get("artist", "")
         album = match_payload.get("album", "")
         year = self._coerce_int(match_payload.get("year", 0), 0)
         genre = match_payload.get("genre", "")
 
+        writes: list[tuple[Path, TagData]] = []
         for index, (_, _, _, path_obj) in enumerate(file_rows):
             track_row = tracks[index] if index < len(tracks) else tracks[-1]
             tag_data = TagData(
-                title=track_row.get("title", ""),
-                artist=track_row.get("artist", album_artist),
+                title=track_row.title,
+                artist=track_row.artist,
                 album=album,
                 albumartist=album_artist,
-                track=self._coerce_int(track_row.get("track"), index + 1),
-                disc=self._coerce_int(track_row.get("disc"), 1),
+                track=track_row.track or index + 1,
+                disc=track_row.disc or 1,
                 year=year,
                 genre=genre,
                 artwork_data=artwork_data,
                 artwork_mime=artwork_mime,
             )
-            tag_writer.write(path_obj, tag_data)
+            writes.append((path_obj, tag_data))
+        self._write_tags(tag_writer, writes)
         return True
 
+    @staticmethod
+    def _file_rows_from_names(
+        paths: list[str | Path],
+        release_positions: set[tuple[int, int]],
+    ) -> list[tuple[int, int, int, Path]] | None:
+        """Order files by the positions in their names, skipping tag reads.
+
+        Returns None unless every name is in the syncer's "NN Title" layout
+        and the positions are distinct tracks of the matched release.
+        """
+        file_rows: list[tuple[int, int, int, Path]] = []
+        positions: set[tuple[int, int]] = set()
+        for index, path in enumerate(paths):
+            path_obj = Path(path)
+            position = _filename_position(path_obj)
+            if position is None or position in positions or position not in release_positions:
+                return None
+            positions.add(position)
+            file_rows.append((*position, index, path_obj))
+        return file_rows
+
     def _apply_single_match(
         self,
         tag_writer: TagManager,
@@ -650,10 +1016,30 @@ class AutoTagger:
             artwork_data=artwork_data,
             artwork_mime=artwork_mime,
         )
-        for path in paths:
-            tag_writer.write(path, tag_data)
+        self._write_tags(tag_writer, [(path, tag_data) for path in paths])
         return True
 
+    @staticmethod
+    def _write_tags(tag_writer: TagManager, writes: list[tuple[str | Path, TagData]]) -> None:
+        """Write tags to several files at once.
+
+        The first failure stops the apply: writes that have not started are
+        cancelled, the ones already running finish, and the error is re-raised.
+        """
+        if len(writes) <= 1:
+            for path, tag_data in writes:
+                tag_writer.write(path, tag_data)
+            return
+        # Each write opens, rewrites and closes its own file, so the disk
+        # round-trips overlap instead of queueing behind one another.
+        with ThreadPoolExecutor(max_workers=min(_TAG_WRITE_WORKERS, len(writes))) as executor:
+            futures = [executor.submit(tag_writer.write, path, tag_data) for path, tag_data in writes]
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise error
+
     @staticmethod
     def _mb_artist_credit(entity: dict[str, Any]) -> str:
         artist_credit = entity.get("artist-credit")
@@ -683,7 +1069,7 @@ class AutoTagger:
             return 0
         for key in ("date", "first-release-date"):
             date_raw = str(release.get(key, "") or "")
-            match = re.match(r"^(\d{4})", date_raw)
+            match = _YEAR_RE.match(date_raw)
             if match:
                 return int(match.group(1))
         return 0
@@ -710,8 +1096,7 @@ class AutoTagger:
     @classmethod
     def _discogs_artwork_urls(cls, release: Any) -> list[str]:
         urls: list[str] = []
-        images = list(getattr(release, "images", None) or [])
-        for image in images:
+        for image in getattr(release, "images", None) or ():
             if not isinstance(image, dict):
                 continue
             # Discogs image payloads commonly expose both URI variants.
@@ -723,15 +1108,24 @@ class AutoTagger:
 
     @staticmethod
     def _discogs_distance(query_artist: str, query_album: str, release: Any) -> float:
+        return AutoTagger._discogs_distance_prepared(
+            query_artist.strip().lower(),
+            query_album.strip().lower(),
+            release,
+        )
+
+    @staticmethod
+    def _discogs_distance_prepared(query_artist: str, query_album: str, release: Any) -> float:
+        """Like _discogs_distance, but the query strings are already stripped and lowered."""
         release_artist = AutoTagger._discogs_artist_name(release)
         release_title = str(getattr(release, "title", "") or "")
-        query_artist = query_artist.strip().lower()
-        query_album = query_album.strip().lower()
         release_artist = release_artist.strip().lower()
         release_title = release_title.strip().lower()
 
         if not query_artist and not query_album:
             return 1.0
+        if query_artist == release_artist and query_album == release_title:
+            return 0.0
 
         artist_weight = 0.4 if query_artist else 0.0
         album_weight = 0.6 if query_album else 0.0
@@ -739,20 +1133,27 @@ class AutoTagger:
         if total <= 0.0:
             return 1.0
 
-        artist_ratio = SequenceMatcher(None, query_artist, release_artist).ratio() if query_artist else 0.0
-        album_ratio = SequenceMatcher(None, query_album, release_title).ratio() if query_album else 0.0
+        artist_ratio = _similarity(query_artist, release_artist) if query_artist else 0.0
+        album_ratio = _similarity(query_album, release_title) if query_album else 0.0
         weighted = ((artist_ratio * artist_weight) + (album_ratio * album_weight)) / total
         return max(0.0, min(1.0, 1.0 - weighted))
 
+    @staticmethod
+    def _length_ms_to_secs(length_ms: Any) -> int:
+        try:
+            return max(0, int(length_ms) // 1000)
+        except (TypeError, ValueError):
+            return 0
+
     @staticmethod
     def _parse_duration(duration: str) -> int:
         duration = duration.strip()
         if not duration:
             return 0
-        if duration.isdigit():
+        if duration.isdecimal():
             return int(duration)
         parts = duration.split(":")
-        if not parts or any(not part.isdigit() for part in parts):
+        if any(not part.isdecimal() for part in parts):
             return 0
         value = 0
         for part in parts:
@@ -765,21 +1166,20 @@ class AutoTagger:
         if not position:
             return default_disc, 0
 
-        match = re.match(r"^(\d+)-(\d+)$", position)
+        match = _DISC_TRACK_RE.match(position)
         if match:
             return int(match.group(1)), int(match.group(2))
 
-        match = re.match(r"^([A-Z])(\d+)$", position)
+        match = _LETTER_TRACK_RE.match(position)
         if match:
             disc_num = ord(match.group(1)) - ord("A") + 1
             return max(1, disc_num), int(match.group(2))
 
-        match = re.match(r"^\d+$", position)
-        if match:
+        if position.isdecimal():
             return default_disc, int(position)
 
         # Fallback: pick first integer from mixed strings like "CD1-03" or "Track 4".
-        match = re.search(r"(\d+)", position)
+        match = _INT_ANY_RE.search(position)
         if match:
             return default_disc, int(match.group(1))
         return default_disc, 0
@@ -787,82 +1187,141 @@ class AutoTagger:
     @classmethod
     def _download_artwork_from_urls(cls, urls: list[str]) -> tuple[bytes, str] | None:
         candidates = cls._expand_artwork_urls(urls)
-        for url in candidates:
-            if not url:
-                continue
-            for attempt in range(3):
-                try:
-                    req = Request(
-                        url,
-                        headers={
-                            "User-Agent": f"MusicOrg/{__version__}",
-                            "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
-                            "Referer": "https://musicbrainz.org/",
-                        },
-                    )
-                    with urlopen(req, timeout=12) as resp:
-                        data = resp.read()
-                        if not data:
-                            break
-                        mime = cls._normalize_content_type(resp.headers.get("Content-Type", ""))
-                        guessed_mime = cls._guess_image_mime(data)
-                        if not mime:
-                            mime = guessed_mime
-                        # Skip obvious HTML/error payloads misreported as binary.
-                        if not mime and cls._looks_like_html(data):
-                            break
-                        if not mime:
-                            mime = "image/jpeg"
-                        return data, mime
-                except Exception as exc:
-                    if attempt >= 2 or not cls._is_transient_network_error(exc):
-                        break
-                    time.sleep(0.25 * (attempt + 1))
-        return None
+        if len(candidates) <= 1:
+            return cls._fetch_artwork(candidates[0]) if candidates else None
+
+        # Hedged fetch: start the preferred URL, and only launch the next
+        # candidate when one fails or stalls past the hedge delay. The first
+        # successful payload wins and queued fetches are cancelled.
+        executor = ThreadPoolExecutor(max_workers=_ARTWORK_FETCH_WORKERS)
+        remaining = iter(candidates)
+        running: set[Future[tuple[bytes, str] | None]] = set()
+
+        def launch_next() -> None:
+            url = next(remaining, None)
+            if url is not None:
+                running.add(executor.submit(cls._fetch_artwork, url))
+
+        try:
+            launch_next()
+            while running:
+                done, _ = wait(running, timeout=_ARTWORK_HEDGE_DELAY, return_when=FIRST_COMPLETED)
+                if not done:
+                    launch_next()
+                    continue
+                for future in done:
+                    running.discard(future)
+                    artwork = future.result()
+                    if artwork is not None:
+                        return artwork
+                    launch_next()
+            return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _fetch_artwork(cls, url: str) -> tuple[bytes, str] | None:
+        cached = _artwork_cache.get(url)
+        if cached is not None:
+            return cached
+        from requests import RequestException
+
+        try:
+            with _http_session().get(
+                url,
+                headers=_ARTWORK_REQUEST_HEADERS,
+                timeout=_ARTWORK_TIMEOUT,
+                stream=True,
+            ) as resp:
+                if resp.status_code >= 400:
+                    return None
+                # HTML error pages are rejected even when served with an image
+                # type, so a fast error page cannot win the hedged race.
+                data = cls._read_artwork_body(resp, MAX_ARTWORK_BYTES)
+        except (RequestException, OSError):
+            return None
+        if not data:
+            return None
+        mime = cls._normalize_content_type(resp.headers.get("Content-Type", ""))
+        if not mime:
+            mime = cls._guess_image_mime(data)
+        if not mime:
+            mime = "image/jpeg"
+        artwork = (data, mime)
+        _artwork_cache.set(url, artwork, _cache_ttl_from_headers(resp.headers, _ARTWORK_CACHE_TTL))
+        return artwork
+
+    @classmethod
+    def _read_artwork_body(cls, resp: requests.Response, limit: int) -> bytes | None:
+        """Read a streamed image body, or None for HTML or bodies over *limit* bytes.
+
+        The HTML check runs on the first chunk, so an error page served with
+        a 200 is dropped without draining the rest of it.
+        """
+        try:
+            declared = int(resp.headers.get("Content-Length", 0) or 0)
+        except (TypeError, ValueError):
+            declared = 0
+        if declared > limit:
+            return None
+        buffer = bytearray()
+        sniffed = False
+        for chunk in resp.iter_content(chunk_size=_ARTWORK_CHUNK_SIZE):
+            buffer += chunk
+            if len(buffer) > limit:
+                return None
+            if not sniffed and len(buffer) >= _HTML_SNIFF_BYTES:
+                if cls._looks_like_html(buffer):
+                    return None
+                sniffed = True
+        if not sniffed and cls._looks_like_html(buffer):
+            return None
+        return bytes(buffer)
 
     @staticmethod
     def _normalize_content_type(content_type: str) -> str:
         if not content_type:
             return ""
-        mime = content_type.split(";", 1)[0].strip().lower()
-        return mime if mime.startswith("image/") else ""
+        mime = content_type.split(";", 1)[0].strip()
+        # Only the short media type is case-folded, and only once it is
+        # known to be an image; parameters such as charset are never lowered.
+        return mime.lower() if mime[:6].lower() == "image/" else ""
 
     @staticmethod
     def _guess_image_mime(data: bytes) -> str:
-        if data.startswith(b"\xFF\xD8\xFF"):
-            return "image/jpeg"
-        if data.startswith(b"\x89PNG\r\n\x1a\n"):
-            return "image/png"
-        if data.startswith(b"RIFF") and b"WEBP" in data[:16]:
+        head = bytes(data[:16])
+        for signature, mime in _IMAGE_SIGNATURES:
+            if head.startswith(signature):
+                return mime
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
             return "image/webp"
-        if data.startswith(b"GIF87a") or data.startswith(b"GIF89a"):
-            return "image/gif"
-        if data.startswith(b"BM"):
-            return "image/bmp"
         return ""
 
     @staticmethod
-    def _looks_like_html(data: bytes) -> bool:
-        snippet = data[:256].lstrip().lower()
+    def _looks_like_html(data: bytes | bytearray) -> bool:
+        snippet = bytes(data[:_HTML_SNIFF_BYTES]).lstrip().lower()
         return snippet.startswith(b"<!doctype html") or snippet.startswith(b"<html")
 
     @classmethod
     def _expand_artwork_urls(cls, urls: list[str]) -> list[str]:
-        expanded: list[str] = []
-        for raw in urls:
-            url = str(raw or "").strip()
-            if not url:
-                continue
-            expanded.append(url)
-            https_url = ""
-            if url.startswith("http://"):
-                https_url = "https://" + url[len("http://"):]
-                expanded.append(https_url)
-            if "coverartarchive.org" in url and "/front-500" in url:
-                expanded.append(url.replace("/front-500", "/front"))
-                if https_url:
-                    expanded.append(https_url.replace("/front-500", "/front"))
-        return cls._dedupe_urls(expanded)
+        return cls._dedupe_urls(
+            variant for raw in urls for variant in cls._artwork_url_variants(str(raw or "").strip())
+        )
+
+    @staticmethod
+    def _artwork_url_variants(url: str) -> Iterator[str]:
+        """Yield *url*, its https upgrade, and full-size Cover Art Archive fallbacks."""
+        if not url:
+            return
+        yield url
+        https_url = ""
+        if url.startswith("http://"):
+            https_url = "https://" + url[len("http://"):]
+            yield https_url
+        if "coverartarchive.org" in url and "/front-500" in url:
+            yield url.replace("/front-500", "/front")
+            if https_url:
+                yield https_url.replace("/front-500", "/front")
 
     def _call_with_retry(
         self,
@@ -878,42 +1337,19 @@ class AutoTagger:
                 last_error = exc
                 if attempt >= 2 or not self._is_transient_network_error(exc):
                     raise
-                time.sleep(0.35 * (attempt + 1))
+                time.sleep(_retry_delay(attempt))
         if last_error is not None:
             raise last_error
         raise RuntimeError("retry wrapper reached an unexpected state")
 
     @staticmethod
-    def _dedupe_urls(urls: list[str]) -> list[str]:
-        deduped: list[str] = []
-        seen: set[str] = set()
-        for url in urls:
-            normalized = str(url or "").strip()
-            if not normalized or normalized in seen:
-                continue
-            seen.add(normalized)
-            deduped.append(normalized)
-        return deduped
+    def _dedupe_urls(urls: Iterable[str]) -> list[str]:
+        # dict.fromkeys keeps first-seen order while dropping repeats.
+        return list(dict.fromkeys(url for url in (str(raw or "").strip() for raw in urls) if url))
 
     @staticmethod
     def _is_transient_network_error(exc: Exception) -> bool:
-        text = " ".join(str(exc).lower().split())
-        transient_markers = (
-            "timed out",
-            "timeout",
-            "forcibly closed",
-            "connection reset",
-            "remote end closed",
-            "temporarily unavailable",
-            "try again",
-            "service unavailable",
-            "winerror 10054",
-            "http error 429",
-            "http error 502",
-            "http error 503",
-            "http error 504",
-        )
-        return any(marker in text for marker in transient_markers)
+        return _TRANSIENT_ERROR_RE.search(str(exc)) is not None
 
     @staticmethod
     def _discogs_artist_name(release: Any) -> str:
@@ -924,6 +1360,12 @@ class AutoTagger:
             return ", ".join(names)
         return str(getattr(release, "artist", "") or "")
 
+    @staticmethod
+    def _discogs_genre(release: Any) -> str:
+        genres = getattr(release, "genres", None) or ()
+        styles = getattr(release, "styles", None) or ()
+        return ", ".join(part for part in chain(genres, styles) if part)
+
     @staticmethod
     def _coerce_int(value: Any, default: int = 0) -> int:
         try:
@@ -933,12 +1375,7 @@ class AutoTagger:
 
     @staticmethod
     def _limit_results(results: Any, limit: int) -> list[Any]:
-        output: list[Any] = []
-        for item in results:
-            output.append(item)
-            if len(output) >= limit:
-                break
-        return output
+        return list(islice(results, limit))
 
     @staticmethod
     def _is_uuid(value: str) -> bool:
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 import hashlib
+import os
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
@@ -12,38 +17,45 @@ if TYPE_CHECKING:
     from musicorg.core.tagger import TagData
 
 DuplicateMatchMode = Literal["strict", "aggressive"]
+# (title, album) or (title, album, artist); empty when there is no title.
+GroupKey = tuple[str, ...]
 
 FORMAT_PRIORITY: dict[str, int] = {
     ".flac": 2,
     ".mp3": 1,
 }
 
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+# Underscore is a word character, so it is folded into the separator class.
+_NON_WORD_RUN_RE = re.compile(r"[\W_]+")
 _LEADING_TRACK_PREFIX_RE = re.compile(
     r"^\s*(?:(?:(?:#|\d{1,3})\s*(?:[-_.]|\u2013|\u2014)\s*)*(?:#|\d{1,3}))\s*(?:(?:[-_.]|\u2013|\u2014)\s*)?"
 )
 
 
+# Artist and album strings repeat on every track of an album, so the
+# normalizers below are memoized instead of re-running the regex engine.
+@lru_cache(maxsize=1 << 16)
 def normalize_title(title: str) -> str:
     """Lowercase, strip, and collapse whitespace."""
-    return re.sub(r"\s+", " ", title.strip().lower())
+    return _WHITESPACE_RUN_RE.sub(" ", title.strip()).lower()
 
 
+@lru_cache(maxsize=1 << 16)
 def _normalize_identity_component(value: str) -> str:
     """Normalize punctuation and spacing for flexible matching."""
-    cleaned = re.sub(r"[^\w]+", " ", value.lower().replace("_", " "))
-    return " ".join(cleaned.split())
+    # Every separator run collapses to one space, so only the ends need trimming.
+    return _NON_WORD_RUN_RE.sub(" ", value.lower()).strip()
 
 
 def _path_hints(path: Path) -> tuple[str, str]:
     """Best-effort (artist, album) from path segments."""
-    album = ""
-    artist = ""
-    parent = path.parent
-    if parent != path:
-        album = parent.name
-        grandparent = parent.parent
-        if grandparent != parent:
-            artist = grandparent.name
+    # String ops on the already-normalized path: Path.parent would build a
+    # new PurePath per level for each file.
+    parent = os.path.dirname(os.fspath(path))
+    grandparent = os.path.dirname(parent)
+    album = os.path.basename(parent)
+    artist = os.path.basename(grandparent) if grandparent != parent else ""
     return artist, album
 
 
@@ -56,29 +68,29 @@ def _normalized_filename_title(path: Path) -> str:
     return _normalize_identity_component(stem)
 
 
-def _metadata_group_key(path: Path, tags: TagData, *, match_artist: bool) -> str:
+def _metadata_group_key(path: Path, tags: TagData, *, match_artist: bool) -> GroupKey:
     title = _normalize_identity_component(tags.title) or _normalized_filename_title(path)
     if not title:
-        return ""
+        return ()
 
     path_artist, path_album = _path_hints(path)
     album = _normalize_identity_component(tags.album) or _normalize_identity_component(path_album)
     if match_artist:
         artist = _normalize_identity_component(tags.artist) or _normalize_identity_component(path_artist)
-        return f"{title} || {album} || {artist}"
-    return f"{title} || {album}"
+        return sys.intern(title), sys.intern(album), sys.intern(artist)
+    return sys.intern(title), sys.intern(album)
 
 
-def _strict_metadata_group_key(tags: TagData, *, match_artist: bool) -> str:
+def _strict_metadata_group_key(tags: TagData, *, match_artist: bool) -> GroupKey:
     """Legacy tag-only duplicate key."""
     title = normalize_title(tags.title)
     if not title:
-        return ""
+        return ()
     album = normalize_title(tags.album)
     if match_artist:
         artist = normalize_title(tags.artist)
-        return f"{title} || {album} || {artist}"
-    return f"{title} || {album}"
+        return sys.intern(title), sys.intern(album), sys.intern(artist)
+    return sys.intern(title), sys.intern(album)
 
 
 def _normalize_match_mode(mode: str) -> DuplicateMatchMode:
@@ -128,7 +140,7 @@ def _union(parent: list[int], rank: list[int], a: int, b: int) -> None:
         rank[ra] += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateFile:
     """One file within a duplicate group."""
 
@@ -140,7 +152,12 @@ class DuplicateFile:
     keep: bool = False
 
 
-@dataclass
+def _keeper_rank(file: DuplicateFile) -> tuple[int, int, int]:
+    """Rank a file as a keeper candidate: format, then bitrate, then size."""
+    return (FORMAT_PRIORITY.get(file.extension, 0), file.bitrate, file.size)
+
+
+@dataclass(slots=True)
 class DuplicateGroup:
     """A set of files sharing the same normalized identity or exact content."""
 
@@ -178,9 +195,9 @@ def find_duplicates(
     normalized_mode = _normalize_match_mode(mode)
 
     files: list[DuplicateFile] = []
-    metadata_keys: list[str] = []
-    metadata_groups: dict[str, list[int]] = {}
-    size_groups: dict[int, list[int]] = {}
+    metadata_keys: list[GroupKey] = []
+    metadata_groups: defaultdict[GroupKey, list[int]] = defaultdict(list)
+    size_groups: defaultdict[int, list[int]] = defaultdict(list)
 
     for path, tags, size in file_tags:
         ext = path.suffix.lower()
@@ -196,9 +213,9 @@ def find_duplicates(
 
         metadata_keys.append(key)
         if key:
-            metadata_groups.setdefault(key, []).append(idx)
+            metadata_groups[key].append(idx)
         if normalized_mode == "aggressive":
-            size_groups.setdefault(size, []).append(idx)
+            size_groups[size].append(idx)
 
     if len(files) < 2:
         return []
@@ -219,13 +236,13 @@ def find_duplicates(
         for indices in size_groups.values():
             if len(indices) < 2:
                 continue
-            hash_groups: dict[str, list[int]] = {}
+            hash_groups: defaultdict[str, list[int]] = defaultdict(list)
             for idx in indices:
                 digest = _file_sha1(files[idx].path, hash_cache)
                 if not digest:
                     continue
                 index_hash[idx] = digest
-                hash_groups.setdefault(digest, []).append(idx)
+                hash_groups[digest].append(idx)
             for same_hash_indices in hash_groups.values():
                 if len(same_hash_indices) < 2:
                     continue
@@ -233,10 +250,9 @@ def find_duplicates(
                 for idx in same_hash_indices[1:]:
                     _union(parent, rank, leader, idx)
 
-    components: dict[int, list[int]] = {}
+    components: defaultdict[int, list[int]] = defaultdict(list)
     for idx in range(len(files)):
-        root = _find(parent, idx)
-        components.setdefault(root, []).append(idx)
+        components[_find(parent, idx)].append(idx)
 
     result: list[DuplicateGroup] = []
     for members in components.values():
@@ -244,17 +260,15 @@ def find_duplicates(
             continue
 
         component_files = [files[idx] for idx in members]
-        component_files.sort(
-            key=lambda f: (FORMAT_PRIORITY.get(f.extension, 0), f.bitrate, f.size),
-            reverse=True,
-        )
+        component_files.sort(key=_keeper_rank, reverse=True)
         component_files[0].keep = True
         for f in component_files[1:]:
             f.keep = False
 
-        component_keys = sorted({metadata_keys[idx] for idx in members if metadata_keys[idx]})
+        component_keys = [metadata_keys[idx] for idx in members if metadata_keys[idx]]
         if component_keys:
-            group_key = component_keys[0]
+            # Keys stay tuples while grouping; only surviving groups get a label.
+            group_key = " || ".join(min(component_keys))
         else:
             component_hashes = sorted({index_hash[idx] for idx in members if idx in index_hash})
             if component_hashes:
@@ -264,5 +278,5 @@ def find_duplicates(
 
         result.append(DuplicateGroup(normalized_key=group_key, files=component_files))
 
-    result.sort(key=lambda g: g.normalized_key)
+    result.sort(key=attrgetter("normalized_key"))
     return result
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
 AUDIO_EXTENSIONS = {
     ".mp3",
@@ -19,8 +21,11 @@ AUDIO_EXTENSIONS = {
     ".tak",  # Tom's lossless Audio Kompressor
 }
 
+# Directory listing is metadata I/O, so more threads than cores pays off.
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-@dataclass
+
+@dataclass(slots=True)
 class AudioFile:
     """Lightweight descriptor for a discovered audio file."""
     path: Path
@@ -34,6 +39,45 @@ class AudioFile:
         self.size = stat.st_size
         self.mtime_ns = stat.st_mtime_ns
 
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry[str], extension: str) -> AudioFile:
+        """Build from a scandir entry, reusing its stat instead of a new lookup."""
+        stat = entry.stat()
+        audio_file = cls.__new__(cls)
+        audio_file.path = Path(entry.path)
+        audio_file.extension = extension
+        audio_file.size = stat.st_size
+        audio_file.mtime_ns = stat.st_mtime_ns
+        return audio_file
+
+
+def _scan_dir(dirpath: str) -> tuple[list[AudioFile], list[str]]:
+    """List one directory: its audio files and subdirectories, both sorted by name.
+
+    Like os.walk, symlinked directories are not descended into and
+    unreadable directories or files are skipped.
+    """
+    files: list[AudioFile] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    if extension in AUDIO_EXTENSIONS:
+                        files.append(AudioFile.from_entry(entry, extension))
+                except OSError:
+                    continue
+    except OSError:
+        return [], []
+    files.sort(key=lambda af: af.path.name)
+    subdirs.sort()
+    return files, subdirs
+
 
 class FileScanner:
     """Scans a directory tree for audio files."""
@@ -42,25 +86,34 @@ class FileScanner:
         self._root = Path(root)
 
     def scan(self) -> list[AudioFile]:
-        """Return all audio files under the root directory."""
-        results: list[AudioFile] = []
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            for fname in sorted(filenames):
-                p = Path(dirpath) / fname
-                if p.suffix.lower() in AUDIO_EXTENSIONS:
-                    try:
-                        results.append(AudioFile(path=p))
-                    except OSError:
-                        continue
-        return results
-
-    def scan_iter(self):
-        """Yield audio files one at a time (for progress reporting)."""
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            for fname in sorted(filenames):
-                p = Path(dirpath) / fname
-                if p.suffix.lower() in AUDIO_EXTENSIONS:
-                    try:
-                        yield AudioFile(path=p)
-                    except OSError:
-                        continue
+        """Return all audio files under the root directory, in scan_iter order."""
+        return list(self.scan_iter())
+
+    def scan_iter(self) -> Iterator[AudioFile]:
+        """Yield audio files one at a time (for progress reporting).
+
+        Directories are yielded top-down and depth-first like os.walk, with
+        files and subdirectories sorted by name within each. The root is
+        listed on the calling thread; only once there are subdirectories do
+        their listings run ahead on a thread pool, so filesystem latency
+        overlaps with the consumer.
+        """
+        files, subdirs = _scan_dir(os.fspath(self._root))
+        yield from files
+        if not subdirs:
+            return
+        # Workers start on demand, so a tree with a few subdirectories only
+        # ever spawns a few threads.
+        executor = ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(subdirs) * 4))
+        try:
+            stack: list[Future[tuple[list[AudioFile], list[str]]]] = [
+                executor.submit(_scan_dir, subdir) for subdir in reversed(subdirs)
+            ]
+            while stack:
+                files, subdirs = stack.pop().result()
+                stack.extend(executor.submit(_scan_dir, subdir) for subdir in reversed(subdirs))
+                yield from files
+        finally:
+            # A consumer that stops early (cancel) should not wait on listings
+            # it will never read.
+            executor.shutdown(wait=False, cancel_futures=True)
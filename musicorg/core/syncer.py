@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import hashlib
+import os
 import re
 import shutil
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
-from musicorg.core.scanner import FileScanner
-from musicorg.core.tagger import TagManager
+from musicorg.core.scanner import AudioFile, FileScanner
+from musicorg.core.tag_cache import TagCache
+from musicorg.core.tagger import TagData, TagManager
 
+_TAG_READ_WORKERS = min(os.cpu_count() or 4, 8)
+# Files per batch of tag reads; at most two batches are in flight at once.
+_TAG_READ_BATCH = 256
+_COPY_WORKERS = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class SyncItem:
     """A single file copy operation."""
 
@@ -23,7 +35,7 @@ class SyncItem:
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncPlan:
     """The full plan for a sync operation."""
 
@@ -35,24 +47,36 @@ class SyncPlan:
 
     @property
     def to_copy(self) -> int:
-        return sum(1 for i in self.items if i.status == "pending")
+        return self.status_counts()["pending"]
 
     @property
     def already_exists(self) -> int:
-        return sum(1 for i in self.items if i.status == "exists")
+        return self.status_counts()["exists"]
 
     @property
     def errors(self) -> int:
-        return sum(1 for i in self.items if i.status == "error")
+        return self.status_counts()["error"]
+
+    def status_counts(self) -> Counter[str]:
+        """Count items per status in one C-level pass.
+
+        Callers that show several totals should call this once rather than
+        reading each property, which would rescan the items for every figure.
+        """
+        return Counter(map(attrgetter("status"), self.items))
+
+
+_ILLEGAL_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+# Underscore is a word character, so it is folded into the separator class.
+_NON_WORD_RUN_RE = re.compile(r"[\W_]+")
 
 
 def _sanitize_filename(name: str) -> str:
     """Remove/replace characters illegal in Windows file names."""
-    # Replace illegal chars with underscore
-    name = re.sub(r'[<>:"/\\|?*]', "_", name)
-    # Remove leading/trailing dots and spaces
-    name = name.strip(". ")
-    return name or "_"
+    # Replace illegal chars with underscore, then drop leading/trailing dots
+    # and spaces. The table handles ASCII and non-ASCII input alike, so no
+    # isascii() branch is needed.
+    return name.translate(_ILLEGAL_FILENAME_CHARS).strip(". ") or "_"
 
 
 def _sanitize_tag_value(value: str) -> str:
@@ -60,6 +84,25 @@ def _sanitize_tag_value(value: str) -> str:
     return value.replace("/", "_").replace("\\", "_")
 
 
+# Longest names first so $albumartist/$disc0/$disc- win over their prefixes.
+_PATH_FORMAT_VAR_RE = re.compile(r"\$(albumartist|artist|album|disc0|disc-|disc|track|title|year)")
+
+
+@lru_cache(maxsize=16)
+def _compile_path_format(path_format: str) -> tuple[tuple[str, str], ...]:
+    """Split a path format into (literal, variable) pairs, parsed once per format.
+
+    The final pair carries the trailing literal and an empty variable name.
+    """
+    parts: list[tuple[str, str]] = []
+    pos = 0
+    for match in _PATH_FORMAT_VAR_RE.finditer(path_format):
+        parts.append((path_format[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((path_format[pos:], ""))
+    return tuple(parts)
+
+
 def _build_dest_path(
     dest_root: Path,
     tags: dict,
@@ -78,19 +121,24 @@ def _build_dest_path(
         tags.get("title") or (source_path.stem if source_path else None) or "Unknown Title"
     )
     year = tags.get("year", 0)
-
-    # Build from format string by substituting variables
-    path_str = path_format
-    path_str = path_str.replace("$albumartist", artist)
-    path_str = path_str.replace("$artist", artist)
-    path_str = path_str.replace("$album", album)
     disc = tags.get("disc", 0)
-    path_str = path_str.replace("$disc0", f"{disc:02d}" if disc else "01")
-    path_str = path_str.replace("$disc-", f"{disc}-" if disc else "")
-    path_str = path_str.replace("$disc", str(disc) if disc else "1")
-    path_str = path_str.replace("$track", f"{track:02d}" if track else "00")
-    path_str = path_str.replace("$title", title)
-    path_str = path_str.replace("$year", str(year) if year else "0000")
+
+    # Substitute variables into the pre-parsed format in a single join
+    values = {
+        "albumartist": artist,
+        "artist": artist,
+        "album": album,
+        "disc0": f"{disc:02d}" if disc else "01",
+        "disc-": f"{disc}-" if disc else "",
+        "disc": str(disc) if disc else "1",
+        "track": f"{track:02d}" if track else "00",
+        "title": title,
+        "year": str(year) if year else "0000",
+        "": "",
+    }
+    path_str = "".join(
+        literal + values[variable] for literal, variable in _compile_path_format(path_format)
+    )
 
     # Split into directory parts and filename, sanitize each
     parts = path_str.replace("\\", "/").split("/")
@@ -113,13 +161,16 @@ def _build_dest_path(
 
 
 def _normalize_track_value(value: str) -> str:
-    return " ".join(value.strip().lower().replace("_", " ").split())
+    # Interned so identity keys sharing an artist/album share one string and
+    # set probes on a hash match short-circuit on pointer equality.
+    return sys.intern(" ".join(value.strip().lower().replace("_", " ").split()))
 
 
+@lru_cache(maxsize=1 << 16)
 def _normalize_identity_component(value: str) -> str:
     """Normalize text for identity matching across punctuation variants."""
-    cleaned = re.sub(r"[^\w]+", " ", value.lower().replace("_", " "))
-    return " ".join(cleaned.split())
+    # Every separator run collapses to one space, so only the ends need trimming.
+    return _NON_WORD_RUN_RE.sub(" ", value.lower()).strip()
 
 
 _LEADING_TRACK_PREFIX_RE = re.compile(
@@ -129,8 +180,19 @@ _LEADING_TRACK_PREFIX_RE = re.compile(
 
 def _normalize_filename_for_match(path: Path) -> tuple[str, str]:
     """Normalize a filename for equivalence checks across prefix variants."""
-    ext = path.suffix.lower()
-    stem = path.stem
+    return _normalize_name_for_match(path.name)
+
+
+@lru_cache(maxsize=1 << 16)
+def _normalize_name_for_match(name: str) -> tuple[str, str]:
+    # Only the final component matters, so identical names in the source and
+    # destination trees (and reverse-sync revisits) share one entry.
+    # Split like PurePath.suffix/stem.
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        stem, ext = name[:dot], name[dot:].lower()
+    else:
+        stem, ext = name, ""
     without_prefix = _LEADING_TRACK_PREFIX_RE.sub("", stem, count=1)
     normalized = _normalize_track_value(_sanitize_filename(without_prefix))
     if normalized:
@@ -147,10 +209,15 @@ def _directory_file_keys(
         return cached
 
     keys: set[tuple[str, str]] = set()
-    if directory.is_dir():
-        for child in directory.iterdir():
-            if child.is_file():
-                keys.add(_normalize_filename_for_match(child))
+    try:
+        # DirEntry carries the file type from readdir, so only symlinks need
+        # an extra stat; a missing or non-directory path lands in OSError.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    keys.add(_normalize_name_for_match(entry.name))
+    except OSError:
+        pass
     cache[directory] = keys
     return keys
 
@@ -159,13 +226,10 @@ def _path_exists_or_equivalent(
     target_path: Path,
     directory_cache: dict[Path, set[tuple[str, str]]],
 ) -> bool:
-    if target_path.exists():
-        return True
-    parent = target_path.parent
-    if not parent.exists():
-        return False
+    # The listing holds every file in the parent (an exact name maps to the
+    # same key), so one scandir per directory replaces a stat per target.
     key = _normalize_filename_for_match(target_path)
-    return key in _directory_file_keys(parent, directory_cache)
+    return key in _directory_file_keys(target_path.parent, directory_cache)
 
 
 def _track_identity(path: Path, tags: dict) -> tuple[str, str, str, int, int]:
@@ -198,14 +262,12 @@ def _identity_tuple(path: Path, tags: dict) -> tuple[str, str, str]:
 
 def _path_artist_album_hints(path: Path) -> tuple[str, str]:
     """Best-effort artist/album guesses from path segments."""
-    album = ""
-    artist = ""
-    parent = path.parent
-    if parent != path:
-        album = parent.name
-        grandparent = parent.parent
-        if grandparent != parent:
-            artist = grandparent.name
+    # String ops on the already-normalized path: Path.parent would build a
+    # new PurePath per level for each file.
+    parent = os.path.dirname(os.fspath(path))
+    grandparent = os.path.dirname(parent)
+    album = os.path.basename(parent)
+    artist = os.path.basename(grandparent) if grandparent != parent else ""
     return artist, album
 
 
@@ -288,11 +350,44 @@ def _has_exact_content_match(
     return False
 
 
+def _planning_tag_dict(tags: TagData) -> dict:
+    """Tag fields for planning; the artwork blob is not needed and not kept."""
+    tag_dict = tags.as_dict()
+    tag_dict["artwork_data"] = None
+    return tag_dict
+
+
+def _flush_tag_cache(
+    cache: TagCache | None,
+    cache_writes: list[tuple[Path, int, int, TagData]],
+) -> None:
+    if cache is None or not cache_writes:
+        return
+    try:
+        cache.put_many(cache_writes)
+    except Exception:
+        pass
+
+
+def _close_tag_cache(cache: TagCache | None) -> None:
+    if cache is None:
+        return
+    try:
+        cache.close()
+    except Exception:
+        pass
+
+
 class SyncManager:
     """Plans and executes non-destructive file copy operations."""
 
-    def __init__(self, path_format: str = "$albumartist/$album/$track $title") -> None:
+    def __init__(
+        self,
+        path_format: str = "$albumartist/$album/$track $title",
+        cache_db_path: str = "",
+    ) -> None:
         self._path_format = path_format
+        self._cache_db_path = cache_db_path
         self._tag_manager = TagManager()
         self._cancelled = False
 
@@ -328,52 +423,49 @@ class SyncManager:
         source_hash_cache: dict[Path, str] = {}
         dest_hash_cache: dict[Path, str] = {}
 
-        for af in dest_files:
-            dest_files_by_size_ext.setdefault((af.size, af.extension), []).append(af.path)
-            try:
-                tags = self._tag_manager.read(af.path)
-                tag_dict = tags.as_dict()
-            except Exception:
-                tag_dict = {}
-            dest_tag_cache[af.path] = tag_dict
-            dest_identity_set.update(_identity_candidates(af.path, tag_dict))
-
-        for af in source_files:
-            source_files_by_size_ext.setdefault((af.size, af.extension), []).append(af.path)
-            if self._cancelled:
-                break
-
-            step += 1
-            if progress_cb:
-                progress_cb(step, total_steps or 1, af.path.name)
+        cache = self._open_tag_cache()
+        # Tag reads are I/O bound, so they run on a pool in bounded batches;
+        # the loops below still consume them in scan order.
+        executor = ThreadPoolExecutor(max_workers=_TAG_READ_WORKERS)
+        try:
+            for af, tag_dict in self._iter_tag_dicts(dest_files, executor, cache):
+                dest_files_by_size_ext.setdefault((af.size, af.extension), []).append(af.path)
+                dest_tag_cache[af.path] = tag_dict
+                dest_identity_set.update(_identity_candidates(af.path, tag_dict))
+
+            for af, tag_dict in self._iter_tag_dicts(source_files, executor, cache):
+                source_files_by_size_ext.setdefault((af.size, af.extension), []).append(af.path)
+                if self._cancelled:
+                    break
 
-            try:
-                tags = self._tag_manager.read(af.path)
-                tag_dict = tags.as_dict()
-            except Exception:
-                tag_dict = {}
+                step += 1
+                if progress_cb:
+                    progress_cb(step, total_steps or 1, af.path.name)
 
-            source_track_keys.add(_track_identity(af.path, tag_dict))
-            source_identity_candidates = _identity_candidates(af.path, tag_dict)
-            source_identity_set.update(source_identity_candidates)
+                source_track_keys.add(_track_identity(af.path, tag_dict))
+                source_identity_candidates = _identity_candidates(af.path, tag_dict)
+                source_identity_set.update(source_identity_candidates)
 
-            dest_path = _build_dest_path(dest_dir, tag_dict, af.extension, self._path_format, af.path)
-            item = SyncItem(source=af.path, dest=dest_path)
+                dest_path = _build_dest_path(dest_dir, tag_dict, af.extension, self._path_format, af.path)
+                item = SyncItem(source=af.path, dest=dest_path)
 
-            if _path_exists_or_equivalent(dest_path, dest_dir_keys):
-                item.status = "exists"
-            elif source_identity_candidates & dest_identity_set:
-                item.status = "exists"
-            elif _has_exact_content_match(
-                af.path,
-                af.size,
-                af.extension,
-                dest_files_by_size_ext,
-                source_hash_cache,
-                dest_hash_cache,
-            ):
-                item.status = "exists"
-            plan.items.append(item)
+                if _path_exists_or_equivalent(dest_path, dest_dir_keys):
+                    item.status = "exists"
+                elif source_identity_candidates & dest_identity_set:
+                    item.status = "exists"
+                elif _has_exact_content_match(
+                    af.path,
+                    af.size,
+                    af.extension,
+                    dest_files_by_size_ext,
+                    source_hash_cache,
+                    dest_hash_cache,
+                ):
+                    item.status = "exists"
+                plan.items.append(item)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            _close_tag_cache(cache)
 
         if include_reverse and not self._cancelled:
             for af in dest_files:
@@ -412,29 +504,96 @@ class SyncManager:
 
         return plan
 
-    def execute_sync(
+    def _open_tag_cache(self) -> TagCache | None:
+        if not self._cache_db_path:
+            return None
+        try:
+            cache = TagCache(self._cache_db_path)
+            cache.open()
+        except Exception:
+            return None
+        return cache
+
+    def _iter_tag_dicts(
         self,
-        plan: SyncPlan,
-        progress_cb: Callable[[int, int, str], None] | None = None,
-        skip_existing: bool = True,
-    ) -> SyncPlan:
-        """Execute the copy operations in the plan.
-
-        Args:
-            plan: The sync plan to execute.
-            progress_cb: Optional callback(current, total, message) for progress updates.
-            skip_existing: If True, skip files that already exist at destination.
-                If False, overwrite existing files.
+        files: list[AudioFile],
+        executor: ThreadPoolExecutor,
+        cache: TagCache | None,
+    ) -> Iterator[tuple[AudioFile, dict]]:
+        """Yield (file, planning tag dict) in order, reading in bounded batches.
+
+        The next batch is queued before the current one is consumed, so reads
+        stay ahead of the caller without holding every result in memory.
         """
-        self._cancelled = False
-        pending = [item for item in plan.items if item.status == "pending"]
-
-        for i, item in enumerate(pending):
+        previous: tuple[list[AudioFile], list[TagData | Future[TagData] | None]] | None = None
+        for start in range(0, len(files), _TAG_READ_BATCH):
+            batch = files[start:start + _TAG_READ_BATCH]
+            queued = (batch, self._submit_tag_reads(batch, executor, cache))
+            if previous is not None:
+                yield from self._resolve_tag_batch(*previous, cache)
+            previous = queued
+        if previous is not None:
+            yield from self._resolve_tag_batch(*previous, cache)
+
+    def _submit_tag_reads(
+        self,
+        files: list[AudioFile],
+        executor: ThreadPoolExecutor,
+        cache: TagCache | None,
+    ) -> list[TagData | Future[TagData] | None]:
+        """Return cached tags where the fingerprint matches, else a queued read."""
+        cached_tags: dict[Path, TagData] = {}
+        if cache is not None:
+            try:
+                cached_tags = cache.get_many(
+                    ((af.path, af.mtime_ns, af.size) for af in files),
+                    include_artwork=False,
+                )
+            except Exception:
+                cached_tags = {}
+        pending: list[TagData | Future[TagData] | None] = []
+        for af in files:
+            cached = cached_tags.get(af.path)
+            if cached is None:
+                pending.append(executor.submit(self._tag_manager.read, af.path))
+            else:
+                pending.append(cached)
+        return pending
+
+    def _resolve_tag_batch(
+        self,
+        files: list[AudioFile],
+        pending: list[TagData | Future[TagData] | None],
+        cache: TagCache | None,
+    ) -> Iterator[tuple[AudioFile, dict]]:
+        """Yield one batch in order, then store its fresh reads in the cache."""
+        cache_writes: list[tuple[Path, int, int, TagData]] = []
+        try:
+            for index, af in enumerate(files):
+                entry = pending[index]
+                # Release each result as soon as it is consumed.
+                pending[index] = None
+                if isinstance(entry, Future):
+                    try:
+                        tags = entry.result()
+                    except Exception:
+                        yield af, {}
+                        continue
+                    cache_writes.append((af.path, af.mtime_ns, af.size, tags))
+                    tag_dict = _planning_tag_dict(tags)
+                else:
+                    tag_dict = _planning_tag_dict(entry)
+                yield af, tag_dict
+        finally:
+            _flush_tag_cache(cache, cache_writes)
+
+    def _copy_items(self, items: list[SyncItem], skip_existing: bool) -> list[SyncItem]:
+        """Copy *items* in order, returning those processed before a cancel."""
+        processed: list[SyncItem] = []
+        for item in items:
             if self._cancelled:
                 break
-
-            if progress_cb:
-                progress_cb(i + 1, len(pending), item.source.name)
+            processed.append(item)
 
             # Extra safety check: verify destination doesn't exist unless overwriting.
             if skip_existing and item.dest.exists():
@@ -448,6 +607,47 @@ class SyncManager:
             except Exception as e:
                 item.status = "error"
                 item.error = str(e)
+        return processed
+
+    def execute_sync(
+        self,
+        plan: SyncPlan,
+        progress_cb: Callable[[int, int, str], None] | None = None,
+        skip_existing: bool = True,
+    ) -> SyncPlan:
+        """Execute the copy operations in the plan.
+
+        Args:
+            plan: The sync plan to execute.
+            progress_cb: Optional callback(current, total, message) for progress updates.
+            skip_existing: If True, skip files that already exist at destination.
+                If False, overwrite existing files.
+        """
+        self._cancelled = False
+        pending = [item for item in plan.items if item.status == "pending"]
+        # Items sharing a destination stay on one task in plan order, so
+        # skip/overwrite resolves exactly as it would copying one by one.
+        by_dest: dict[Path, list[SyncItem]] = {}
+        for item in pending:
+            by_dest.setdefault(item.dest, []).append(item)
+
+        completed = 0
+        # shutil.copy2 already copies in-kernel (sendfile) where the platform
+        # allows; a few copies in flight keep the disk queue busy.
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            futures = [
+                executor.submit(self._copy_items, items, skip_existing)
+                for items in by_dest.values()
+            ]
+            for future in as_completed(futures):
+                for item in future.result():
+                    completed += 1
+                    if progress_cb:
+                        progress_cb(completed, len(pending), item.source.name)
+                if self._cancelled:
+                    for queued in futures:
+                        queued.cancel()
+                    break
 
         return plan
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable, Sequence, TypeVar
 
 from musicorg.core.tagger import TagData
 
@@ -33,6 +34,45 @@ CREATE TABLE IF NOT EXISTS tag_cache (
 """
 
 
+_TAG_COLUMNS = """
+    title, artist, album, albumartist,
+    track, disc, year, genre, composer,
+    duration, bitrate, artwork_data, artwork_mime,
+    comment, lyrics
+"""
+# Same column order, with the artwork blob left in the database.
+_TAG_COLUMNS_WITHOUT_ARTWORK = _TAG_COLUMNS.replace("artwork_data, artwork_mime", "NULL, ''", 1)
+# Bumped when the meaning of the path key changes, dropping rows written under
+# the old keys. 1: os.path.abspath instead of Path.resolve().
+_PATH_KEY_VERSION = 1
+# Stay under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999).
+_MAX_QUERY_PARAMS = 900
+
+PathKey = TypeVar("PathKey", str, Path)
+
+
+def _row_to_tags(row: Sequence[Any]) -> TagData:
+    """Build TagData from the _TAG_COLUMNS part of a result row."""
+    artwork = row[11]
+    return TagData(
+        title=str(row[0] or ""),
+        artist=str(row[1] or ""),
+        album=str(row[2] or ""),
+        albumartist=str(row[3] or ""),
+        track=int(row[4] or 0),
+        disc=int(row[5] or 0),
+        year=int(row[6] or 0),
+        genre=str(row[7] or ""),
+        composer=str(row[8] or ""),
+        duration=float(row[9] or 0.0),
+        bitrate=int(row[10] or 0),
+        artwork_data=bytes(artwork) if artwork is not None else None,
+        artwork_mime=str(row[12] or ""),
+        comment=str(row[13] or ""),
+        lyrics=str(row[14] or ""),
+    )
+
+
 class TagCache:
     """Caches TagData per file path and file fingerprint.
     
@@ -52,6 +92,10 @@ class TagCache:
         conn = sqlite3.connect(self._db_path, check_same_thread=False)
         conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA synchronous=NORMAL;")
+        # Serve reads from a memory map instead of read() calls, and keep
+        # temporary b-trees off disk.
+        conn.execute("PRAGMA mmap_size=268435456;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
         conn.execute(SCHEMA_SQL)
         # Migrate existing DBs: add missing columns
         # SECURITY: Column definitions are hardcoded literals below.
@@ -66,6 +110,12 @@ class TagCache:
                 conn.execute(f"ALTER TABLE tag_cache ADD COLUMN {col_def}")
             except sqlite3.OperationalError:
                 pass  # Column already exists
+        # Rows keyed by an older normalization can never be hit or
+        # invalidated again, and resolved symlink targets cannot be mapped
+        # back to the path the caller used, so they are discarded once.
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _PATH_KEY_VERSION:
+            conn.execute("DELETE FROM tag_cache")
+            conn.execute(f"PRAGMA user_version = {_PATH_KEY_VERSION}")
         conn.commit()
         self._conn = conn
 
@@ -79,12 +129,8 @@ class TagCache:
     def get(self, path: str | Path, mtime_ns: int, size: int) -> TagData | None:
         """Return cached tags when path and fingerprint match."""
         row = self._conn_or_raise().execute(
-            """
-            SELECT
-                title, artist, album, albumartist,
-                track, disc, year, genre, composer,
-                duration, bitrate, artwork_data, artwork_mime,
-                comment, lyrics
+            f"""
+            SELECT {_TAG_COLUMNS}
             FROM tag_cache
             WHERE path = ? AND mtime_ns = ? AND size = ?
             """,
@@ -92,24 +138,45 @@ class TagCache:
         ).fetchone()
         if row is None:
             return None
-        artwork = row[11]
-        return TagData(
-            title=str(row[0] or ""),
-            artist=str(row[1] or ""),
-            album=str(row[2] or ""),
-            albumartist=str(row[3] or ""),
-            track=int(row[4] or 0),
-            disc=int(row[5] or 0),
-            year=int(row[6] or 0),
-            genre=str(row[7] or ""),
-            composer=str(row[8] or ""),
-            duration=float(row[9] or 0.0),
-            bitrate=int(row[10] or 0),
-            artwork_data=bytes(artwork) if artwork is not None else None,
-            artwork_mime=str(row[12] or ""),
-            comment=str(row[13] or ""),
-            lyrics=str(row[14] or ""),
-        )
+        return _row_to_tags(row)
+
+    def get_many(
+        self,
+        fingerprints: Iterable[tuple[PathKey, int, int]],
+        *,
+        include_artwork: bool = True,
+    ) -> dict[PathKey, TagData]:
+        """Return cached tags for every (path, mtime_ns, size) that still matches.
+
+        Lookups run as chunked ``path IN (...)`` queries instead of one
+        statement per file. The result is keyed by the paths as passed in.
+        With *include_artwork* False the image blobs are not loaded.
+        """
+        columns = _TAG_COLUMNS if include_artwork else _TAG_COLUMNS_WITHOUT_ARTWORK
+        wanted: dict[str, tuple[PathKey, int, int]] = {
+            self._normalize_path(path): (path, int(mtime_ns), int(size))
+            for path, mtime_ns, size in fingerprints
+        }
+        conn = self._conn_or_raise()
+        normalized = list(wanted)
+        found: dict[PathKey, TagData] = {}
+        for start in range(0, len(normalized), _MAX_QUERY_PARAMS):
+            chunk = normalized[start:start + _MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            # SECURITY: only "?" placeholders are interpolated; paths stay bound.
+            rows = conn.execute(
+                f"""
+                SELECT path, mtime_ns, size, {columns}
+                FROM tag_cache
+                WHERE path IN ({placeholders})
+                """,
+                chunk,
+            )
+            for row in rows:
+                path, mtime_ns, size = wanted[row[0]]
+                if row[1] == mtime_ns and row[2] == size:
+                    found[path] = _row_to_tags(row[3:])
+        return found
 
     def put(self, path: str | Path, mtime_ns: int, size: int, tags: TagData) -> None:
         """Upsert one cache record."""
@@ -120,7 +187,9 @@ class TagCache:
         entries: Iterable[tuple[str | Path, int, int, TagData]],
     ) -> None:
         """Batch upsert cache records. Thread-safe."""
-        rows = [
+        # Rows are streamed into executemany so a large batch never holds a
+        # second full copy of every artwork blob in memory.
+        rows = (
             (
                 self._normalize_path(path),
                 int(mtime_ns),
@@ -142,10 +211,7 @@ class TagCache:
                 tags.lyrics,
             )
             for path, mtime_ns, size, tags in entries
-        ]
-        if not rows:
-            return
-        
+        )
         with self._lock:
             conn = self._conn_or_raise()
             conn.executemany(
@@ -187,9 +253,7 @@ class TagCache:
 
     def invalidate_many(self, paths: Iterable[str | Path]) -> None:
         """Remove multiple paths from cache. Thread-safe."""
-        rows = [(self._normalize_path(path),) for path in paths]
-        if not rows:
-            return
+        rows = ((self._normalize_path(path),) for path in paths)
         with self._lock:
             conn = self._conn_or_raise()
             conn.executemany("DELETE FROM tag_cache WHERE path = ?", rows)
@@ -209,7 +273,6 @@ class TagCache:
 
     @staticmethod
     def _normalize_path(path: str | Path) -> str:
-        try:
-            return str(Path(path).resolve())
-        except Exception:
-            return str(Path(path))
+        # Pure string normalization: Path.resolve() stats every component,
+        # which dominates cache hits on network shares.
+        return os.path.abspath(path)
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+import os
 from pathlib import Path
-from typing import Any, Self
+import threading
+from typing import Any, Iterable, Self
 
 import music_tag
+from music_tag.util import sanitize_year
+from mutagen.flac import FLAC
+from mutagen.mp3 import MP3
+from mutagen.mp4 import MP4, MP4Cover
 
 from musicorg.errors import (
     ErrorCode,
@@ -16,7 +23,7 @@ from musicorg.errors import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TagData:
     """Clean data transfer object for audio tags."""
     title: str = ""
@@ -55,9 +62,26 @@ class TagData:
         }
 
 
+_JPEG_FORMATS = frozenset({"jpg", "jpeg"})
+_MIME_TO_ARTWORK_FORMAT = {
+    "image/jpeg": "jpeg",
+    "image/jpg": "jpeg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "image/bmp": "bmp",
+    "image/gif": "gif",
+}
+
+
 def _coerce_artwork_bytes(value: Any) -> bytes | None:
     if value is None:
         return None
+    # Artwork from mutagen is already bytes; return it without a copy.
+    value_type = type(value)
+    if value_type is bytes:
+        return value or None
+    if value_type is bytearray or value_type is memoryview:
+        return bytes(value) or None
     if isinstance(value, (bytes, bytearray, memoryview)):
         data = bytes(value)
         return data or None
@@ -80,28 +104,17 @@ def _infer_artwork_mime(artwork: Any) -> str:
     fmt = str(getattr(artwork, "format", "")).strip().lower()
     if not fmt:
         return ""
-    if fmt in {"jpg", "jpeg"}:
+    if fmt in _JPEG_FORMATS:
         return "image/jpeg"
     return f"image/{fmt}"
 
 
 def _infer_artwork_format(mime: str) -> str | None:
     normalized = mime.strip().lower()
-    if not normalized:
-        return None
-    if normalized in {"image/jpeg", "image/jpg"}:
-        return "jpeg"
-    if normalized == "image/png":
-        return "png"
-    if normalized == "image/webp":
-        return "webp"
-    if normalized == "image/bmp":
-        return "bmp"
-    if normalized == "image/gif":
-        return "gif"
-    if normalized.startswith("image/"):
-        return normalized.split("/", 1)[1]
-    return None
+    fmt = _MIME_TO_ARTWORK_FORMAT.get(normalized)
+    if fmt is None and normalized.startswith("image/"):
+        fmt = normalized[6:]
+    return fmt
 
 
 def _build_artwork(raw: bytes, mime: str) -> Any:
@@ -130,9 +143,13 @@ def _build_artwork(raw: bytes, mime: str) -> Any:
     raise ValueError("No supported artwork constructor available")
 
 
+# music-tag already hands back str/int values for most fields, so the exact
+# type checks below return them as-is instead of re-converting.
 def _str(f: Any, key: str) -> str:
     try:
         val = f[key].first
+        if type(val) is str:
+            return val
         return str(val) if val is not None else ""
     except Exception:
         return ""
@@ -141,6 +158,8 @@ def _str(f: Any, key: str) -> str:
 def _int(f: Any, key: str) -> int:
     try:
         val = f[key].first
+        if type(val) is int:
+            return val
         if val is None:
             return 0
         return int(val)
@@ -158,11 +177,217 @@ def _float(f: Any, key: str) -> float:
         return 0.0
 
 
+# Direct mutagen readers for the common formats. They mirror music-tag's
+# field mapping (ID3v2.4 frames, Vorbis comments, MP4 atoms) without its
+# format sniffing and per-field wrapper objects; anything else, or any file
+# these cannot parse, goes through music-tag.
+def _int_or_zero(value: Any) -> int:
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _year_or_zero(value: Any) -> int:
+    try:
+        return sanitize_year(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _id3_text(tags: Any, frame_id: str) -> str:
+    for frame in tags.getall(frame_id):
+        text = frame.text
+        if isinstance(text, (list, tuple)):
+            if text:
+                return str(text[0])
+        else:
+            return str(text)
+    return ""
+
+
+def _id3_number(tags: Any, frame_id: str) -> int:
+    frame = tags.get(frame_id)
+    if frame is None:
+        return 0
+    # "3/12" -> "3"; partition stops at the first slash without building a list.
+    return _int_or_zero(str(frame).partition("/")[0])
+
+
+def _id3_year(tags: Any) -> int:
+    for frame_id in ("TDOR", "TORY", "TYER", "TDAT", "TDRC"):
+        if frame_id in tags:
+            return _year_or_zero(_id3_text(tags, frame_id))
+    return 0
+
+
+def _read_mp3_mutagen(path: str, include_artwork: bool) -> TagData:
+    mfile = MP3(path)
+    info = mfile.info
+    tags = mfile.tags
+    if tags is None:
+        return TagData(duration=float(info.length), bitrate=int(info.bitrate))
+    artwork_data: bytes | None = None
+    artwork_mime = ""
+    if include_artwork:
+        pictures = tags.getall("APIC") or tags.getall("PIC")
+        if pictures:
+            artwork_data = _coerce_artwork_bytes(pictures[0].data)
+            artwork_mime = pictures[0].mime
+    return TagData(
+        title=_id3_text(tags, "TIT2"),
+        artist=_id3_text(tags, "TPE1"),
+        album=_id3_text(tags, "TALB"),
+        albumartist=_id3_text(tags, "TPE2"),
+        track=_id3_number(tags, "TRCK"),
+        disc=_id3_number(tags, "TPOS"),
+        year=_id3_year(tags),
+        genre=_id3_text(tags, "TCON"),
+        composer=_id3_text(tags, "TCOM"),
+        comment=_id3_text(tags, "COMM"),
+        lyrics=_id3_text(tags, "USLT"),
+        duration=float(info.length),
+        bitrate=int(info.bitrate),
+        artwork_data=artwork_data,
+        artwork_mime=artwork_mime,
+    )
+
+
+def _read_flac_mutagen(path: str, include_artwork: bool) -> TagData:
+    mfile = FLAC(path)
+    info = mfile.info
+    tags = mfile.tags
+    if tags is None:
+        tags = {}
+    empty = [""]
+    year = 0
+    for key in ("date", "originaldate"):
+        if key in tags:
+            year = _year_or_zero(tags[key][0])
+            break
+    artwork_data: bytes | None = None
+    artwork_mime = ""
+    if include_artwork and mfile.pictures:
+        picture = mfile.pictures[0]
+        artwork_data = _coerce_artwork_bytes(picture.data)
+        artwork_mime = picture.mime
+    return TagData(
+        title=tags.get("title", empty)[0],
+        artist=tags.get("artist", empty)[0],
+        album=tags.get("album", empty)[0],
+        albumartist=tags.get("albumartist", empty)[0],
+        track=_int_or_zero(tags.get("tracknumber", empty)[0]),
+        disc=_int_or_zero(tags.get("discnumber", empty)[0]),
+        year=year,
+        genre=tags.get("genre", empty)[0],
+        composer=tags.get("composer", empty)[0],
+        comment=tags.get("comment", empty)[0],
+        lyrics=tags.get("lyrics", empty)[0],
+        duration=float(info.length),
+        bitrate=int(info.bitrate),
+        artwork_data=artwork_data,
+        artwork_mime=artwork_mime,
+    )
+
+
+_MP4_COVER_MIMES = {
+    MP4Cover.FORMAT_JPEG: "image/jpeg",
+    MP4Cover.FORMAT_PNG: "image/png",
+}
+
+
+def _read_m4a_mutagen(path: str, include_artwork: bool) -> TagData:
+    mfile = MP4(path)
+    info = mfile.info
+    tags = mfile.tags
+    if tags is None:
+        tags = {}
+    empty = [""]
+    no_pair = [(0, 0)]
+    artwork_data: bytes | None = None
+    artwork_mime = ""
+    if include_artwork:
+        covers = tags.get("covr")
+        if covers:
+            artwork_data = bytes(covers[0]) or None
+            artwork_mime = _MP4_COVER_MIMES.get(covers[0].imageformat, "")
+    return TagData(
+        title=str(tags.get("©nam", empty)[0]),
+        artist=str(tags.get("©ART", empty)[0]),
+        album=str(tags.get("©alb", empty)[0]),
+        albumartist=str(tags.get("aART", empty)[0]),
+        track=_int_or_zero((tags.get("trkn", no_pair)[0] or (0,))[0]),
+        disc=_int_or_zero((tags.get("disk", no_pair)[0] or (0,))[0]),
+        year=_year_or_zero(tags["©day"][0]) if "©day" in tags else 0,
+        genre=str(tags.get("©gen", empty)[0]),
+        composer=str(tags.get("©wrt", empty)[0]),
+        comment=str(tags.get("©cmt", empty)[0]),
+        lyrics=str(tags.get("©lyr", empty)[0]),
+        duration=float(getattr(info, "length", 0.0)),
+        bitrate=int(getattr(info, "bitrate", 0)),
+        artwork_data=artwork_data,
+        artwork_mime=artwork_mime,
+    )
+
+
+_FAST_READERS = {
+    ".mp3": _read_mp3_mutagen,
+    ".flac": _read_flac_mutagen,
+    ".m4a": _read_m4a_mutagen,
+}
+
+
+# music_tag.load_file lets mutagen.File score every known format against the
+# header before picking a wrapper class. For extensions that name a single
+# format, build that wrapper directly; a mismatch falls back to sniffing.
+_MUSIC_TAG_CLASSES: dict[str, type[music_tag.AudioFile]] = {
+    ".mp3": music_tag.id3.Mp3File,
+    ".flac": music_tag.flac.FlacFile,
+    ".m4a": music_tag.mp4.Mp4File,
+    ".opus": music_tag.vorbis.OggOpusFile,
+    ".aiff": music_tag.aiff.AiffFile,
+    ".wv": music_tag.apev2.WavePackFile,
+    ".ape": music_tag.apev2.MonkeysAudioFile,
+}
+
+
+def _load_music_tag_file(filename: str) -> Any:
+    kls = _MUSIC_TAG_CLASSES.get(os.path.splitext(filename)[1].lower())
+    if kls is not None:
+        try:
+            return kls(filename, _mfile=kls.mutagen_kls(filename))
+        except Exception:
+            pass
+    return music_tag.load_file(filename)
+
+
+_READ_WORKERS = min(os.cpu_count() or 4, 8)
+
+
+def _read_in_worker(path: str | Path) -> TagData:
+    # Process pools pickle the callable; a fresh manager avoids shipping the
+    # caller's prepared-artwork state to every worker.
+    return TagManager().read(path)
+
+
 class TagManager:
     """Reads and writes tags for audio files using music-tag."""
 
-    def read(self, path: str | Path) -> TagData:
+    def __init__(self) -> None:
+        # Per thread: (raw, mime, artwork) for the last embedded image. Album
+        # writes pass the same bytes object for every track, so each writer
+        # thread decodes it once and no Artwork is shared between threads.
+        self._prepared_artwork = threading.local()
+
+    def read(self, path: str | Path, *, include_artwork: bool = True) -> TagData:
         """Read tags from an audio file.
+
+        Args:
+            path: Path to the audio file.
+            include_artwork: If False, skip extracting the embedded picture;
+                callers that only need text fields avoid copying the image.
         
         Returns:
             TagData object with tag values (empty strings/zeros if read fails).
@@ -170,11 +395,20 @@ class TagManager:
         Raises:
             MusicOrgError: If file cannot be accessed or is corrupt.
         """
-        path = Path(path)
+        # Bulk scans already hold Path objects; mutagen wants a str, and a
+        # Path is only worth building for error reporting.
+        filename = os.fspath(path)
+        fast_reader = _FAST_READERS.get(os.path.splitext(filename)[1].lower())
+        if fast_reader is not None:
+            try:
+                return fast_reader(filename, include_artwork)
+            except Exception:
+                # Let music-tag sniff the real format and classify the error.
+                pass
         try:
-            f = music_tag.load_file(str(path))
+            f = _load_music_tag_file(filename)
         except Exception as exc:
-            error = classify_exception(exc, path)
+            error = classify_exception(exc, Path(filename))
             # Return empty tags for unreadable/corrupt files (backward compatible behavior)
             if error.code in (
                 ErrorCode.FILE_NOT_FOUND,
@@ -187,7 +421,7 @@ class TagManager:
         artwork_data: bytes | None = None
         artwork_mime = ""
         try:
-            aw = f["artwork"].first
+            aw = f["artwork"].first if include_artwork else None
             if aw is not None:
                 artwork_data = _coerce_artwork_bytes(getattr(aw, "raw", None))
                 if artwork_data is None:
@@ -216,6 +450,36 @@ class TagManager:
             artwork_mime=artwork_mime,
         )
 
+    def read_many(
+        self,
+        paths: Iterable[str | Path],
+        max_workers: int | None = None,
+        use_processes: bool = False,
+    ) -> list[TagData]:
+        """Read tags for many files concurrently, in input order.
+
+        Threads suit the common I/O-bound case; *use_processes* moves parsing
+        into worker processes when decoding is CPU-bound. The first error
+        raised by ``read`` propagates.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_read_in_worker, paths, chunksize=16))
+        with ThreadPoolExecutor(max_workers=max_workers or _READ_WORKERS) as executor:
+            return list(executor.map(self.read, paths))
+
+    def _artwork_for(self, raw: bytes, mime: str) -> Any:
+        local = self._prepared_artwork
+        prepared: tuple[bytes, str, Any] | None = getattr(local, "value", None)
+        if prepared is not None and prepared[0] is raw and prepared[1] == mime:
+            return prepared[2]
+        artwork = _build_artwork(raw=raw, mime=mime)
+        local.value = (raw, mime, artwork)
+        return artwork
+
     def write(self, path: str | Path, tags: TagData) -> None:
         """Write tags to an audio file.
         
@@ -226,11 +490,12 @@ class TagManager:
         Raises:
             MusicOrgError: If file cannot be written or tags are invalid.
         """
-        path = Path(path)
-        
+        filename = os.fspath(path)
+
         try:
-            f = music_tag.load_file(str(path))
+            f = _load_music_tag_file(filename)
         except Exception as exc:
+            path = Path(filename)
             error = classify_exception(exc, path)
             match error.code:
                 case ErrorCode.FILE_NOT_FOUND:
@@ -261,13 +526,14 @@ class TagManager:
             if tags.artwork_data is not None:
                 try:
                     if tags.artwork_data:
-                        f["artwork"] = _build_artwork(
-                            raw=tags.artwork_data,
-                            mime=tags.artwork_mime or "image/jpeg",
+                        f["artwork"] = self._artwork_for(
+                            tags.artwork_data,
+                            tags.artwork_mime or "image/jpeg",
                         )
                     else:
                         f["artwork"] = None
                 except Exception as exc:
+                    path = Path(filename)
                     raise MusicOrgError(
                         ErrorCode.TAG_WRITE_FAILED,
                         message=f"Failed to embed artwork for {path.name}",
@@ -280,6 +546,7 @@ class TagManager:
         except MusicOrgError:
             raise
         except Exception as exc:
+            path = Path(filename)
             error = classify_exception(exc, path)
             error.message = f"Failed to save tags for {path.name}"
             error.suggestion = "The file may be locked or the tag format unsupported. Try again or check file permissions."
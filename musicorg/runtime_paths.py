@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import sys
 
+_SOURCE_PACKAGE_DIR = Path(__file__).resolve().parent
+
 
 def is_frozen() -> bool:
     """Return True when running from a PyInstaller bundle."""
@@ -17,7 +19,7 @@ def bundle_root() -> Path:
         meipass = getattr(sys, "_MEIPASS", None)
         if meipass:
             return Path(meipass)
-    return Path(__file__).resolve().parent.parent
+    return _SOURCE_PACKAGE_DIR.parent
 
 
 def package_root() -> Path:
@@ -28,7 +30,7 @@ def package_root() -> Path:
         if candidate.exists():
             return candidate
         return root
-    return Path(__file__).resolve().parent
+    return _SOURCE_PACKAGE_DIR
 
 
 def asset_path(*parts: str) -> Path:
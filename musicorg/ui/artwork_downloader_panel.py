@@ -192,7 +192,7 @@ class ArtworkDownloaderPanel(QDialog):
         if not self._files:
             return
         try:
-            tags = TagManager().read(self._files[0])
+            tags = TagManager().read(self._files[0], include_artwork=False)
         except Exception:
             return
         self._artist_edit.setText(tags.albumartist or tags.artist)
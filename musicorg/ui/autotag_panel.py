@@ -202,7 +202,7 @@ class AutoTagPanel(QDialog):
             try:
                 from musicorg.core.tagger import TagManager
                 tag_reader = TagManager()
-                tags = tag_reader.read(self._files[0])
+                tags = tag_reader.read(self._files[0], include_artwork=False)
                 self._artist_edit.setText(tags.albumartist or tags.artist)
                 self._album_edit.setText(tags.album)
                 self._title_edit.setText(tags.title)
@@ -368,19 +368,19 @@ class AutoTagPanel(QDialog):
             self._track_table.setItem(
                 row_index,
                 0,
-                QTableWidgetItem(str(track_row.get("track", ""))),
+                QTableWidgetItem(str(track_row.track)),
             )
             self._track_table.setItem(
                 row_index,
                 1,
-                QTableWidgetItem(track_row.get("title", "")),
+                QTableWidgetItem(track_row.title),
             )
             self._track_table.setItem(
                 row_index,
                 2,
-                QTableWidgetItem(track_row.get("artist", "")),
+                QTableWidgetItem(track_row.artist),
             )
-            length = track_row.get("length", 0)
+            length = track_row.length
             if length:
                 mins, secs = divmod(int(length), 60)
                 self._track_table.setItem(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Callable, Literal, Mapping
 
 from PySide6.QtCore import Qt
@@ -221,7 +222,7 @@ class KeybindRegistry:
             )
             for spec in self._specs
         ]
-        return sorted(rows, key=lambda row: (row.category, row.label))
+        return sorted(rows, key=attrgetter("category", "label"))
 
 
 def create_bound_action(
@@ -108,6 +108,7 @@ class MainWindow(QMainWindow):
         self._artwork_downloader_panel.set_cache_db_path(cache_path)
         self._autotag_panel.set_discogs_token(self._settings.discogs_token)
         self._artwork_downloader_panel.set_discogs_token(self._settings.discogs_token)
+        self._sync_panel.set_cache_db_path(cache_path)
         self._duplicates_panel.set_cache_db_path(cache_path)
         self._raw_files_panel.set_cache_db_path(cache_path)
 
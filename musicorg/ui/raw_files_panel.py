@@ -158,14 +158,8 @@ class RawFilesPanel(QWidget):
         self._cache_db_path = path
 
     def selected_paths(self) -> list[Path]:
-        selected: list[Path] = []
-        seen: set[Path] = set()
-        for item in self._tree.selectedItems():
-            path = self._item_path(item)
-            if path is None or path in seen:
-                continue
-            seen.add(path)
-            selected.append(path)
+        paths = (self._item_path(item) for item in self._tree.selectedItems())
+        selected = list(dict.fromkeys(path for path in paths if path is not None))
         selected.sort(key=lambda path: self._order_index.get(path, len(self._ordered_paths)))
         return selected
 
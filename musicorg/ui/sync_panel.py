@@ -33,6 +33,7 @@ class SyncPanel(QWidget):
         self._plan_thread: QThread | None = None
         self._sync_worker: SyncExecuteWorker | None = None
         self._sync_thread: QThread | None = None
+        self._cache_db_path = ""
 
         self._setup_ui()
 
@@ -94,6 +95,9 @@ class SyncPanel(QWidget):
         self._progress = ProgressIndicator()
         layout.addWidget(self._progress)
 
+    def set_cache_db_path(self, path: str) -> None:
+        self._cache_db_path = path
+
     def set_source_dir(self, path: str) -> None:
         self._source_picker.set_path(path)
 
@@ -128,7 +132,13 @@ class SyncPanel(QWidget):
         path_format = self._format_edit.text().strip() or "$albumartist/$album/$track $title"
 
         include_reverse = self._reverse_sync_check.isChecked()
-        self._plan_worker = SyncPlanWorker(source, dest, path_format, include_reverse)
+        self._plan_worker = SyncPlanWorker(
+            source,
+            dest,
+            path_format,
+            include_reverse,
+            cache_db_path=self._cache_db_path,
+        )
         self._plan_thread = QThread()
         self._plan_worker.moveToThread(self._plan_thread)
         self._plan_thread.started.connect(self._plan_worker.run)
@@ -147,12 +157,13 @@ class SyncPanel(QWidget):
         self._plan = plan
         self._populate_plan_table()
         self._plan_btn.setEnabled(True)
-        self._sync_btn.setEnabled(plan.to_copy > 0)
+        counts = plan.status_counts()
+        self._sync_btn.setEnabled(counts["pending"] > 0)
         summary = (
             f"Total: {plan.total} | "
-            f"To copy: {plan.to_copy} | "
-            f"Already exists: {plan.already_exists} | "
-            f"Errors: {plan.errors}"
+            f"To copy: {counts['pending']} | "
+            f"Already exists: {counts['exists']} | "
+            f"Errors: {counts['error']}"
         )
         self._summary_label.setText(summary)
         self._progress.finish("Plan ready")
@@ -220,15 +231,16 @@ class SyncPanel(QWidget):
     def _on_sync_done(self, plan: SyncPlan) -> None:
         self._plan = plan
         self._populate_plan_table()
-        copied = sum(1 for i in plan.items if i.status == "copied")
-        errors = sum(1 for i in plan.items if i.status == "error")
+        counts = plan.status_counts()
+        copied = counts["copied"]
+        errors = counts["error"]
         self._progress.finish(f"Sync complete: {copied} copied, {errors} errors")
         self._plan_btn.setEnabled(True)
         self._cancel_btn.setEnabled(False)
         summary = (
             f"Total: {plan.total} | "
             f"Copied: {copied} | "
-            f"Already exists: {plan.already_exists} | "
+            f"Already exists: {counts['exists']} | "
             f"Errors: {errors}"
         )
         self._summary_label.setText(summary)
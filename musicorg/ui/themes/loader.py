@@ -36,25 +36,52 @@ def load_theme_package(theme_dir: Path, *, is_builtin: bool = False) -> ThemePac
         raise ThemeValidationError(f"Theme directory cannot be a symlink: {theme_dir}")
 
     manifest_data = _load_json(theme_dir / "manifest.json", max_bytes=_MAX_MANIFEST_BYTES)
-    manifest = _parse_manifest(manifest_data, theme_dir)
     tokens_data = _load_json(theme_dir / "tokens.json", max_bytes=_MAX_TOKENS_BYTES)
-    tokens = _parse_tokens(tokens_data, theme_dir)
 
-    fonts: dict[str, str] = {}
+    fonts_data: Mapping[str, object] | None = None
     fonts_path = theme_dir / "fonts.json"
     if fonts_path.exists():
-        fonts = _parse_fonts(_load_json(fonts_path, max_bytes=_MAX_FONTS_BYTES), theme_dir)
+        fonts_data = _load_json(fonts_path, max_bytes=_MAX_FONTS_BYTES)
 
     overrides_qss = ""
     overrides_path = theme_dir / "overrides.qss"
     if overrides_path.exists():
         overrides_qss = _read_text_limited(overrides_path, max_bytes=_MAX_OVERRIDES_BYTES)
-        if _BLOCKED_OVERRIDES_RE.search(overrides_qss):
-            raise ThemeValidationError(
-                f"{theme_dir}: overrides.qss may not contain @import or url(...) directives"
-            )
 
-    preview_path = _find_preview_path(theme_dir)
+    return build_theme_package(
+        theme_dir,
+        manifest_data=manifest_data,
+        tokens_data=tokens_data,
+        fonts_data=fonts_data,
+        overrides_qss=overrides_qss,
+        preview_path=_find_preview_path(theme_dir),
+        is_builtin=is_builtin,
+    )
+
+
+def build_theme_package(
+    theme_dir: Path,
+    *,
+    manifest_data: Mapping[str, object],
+    tokens_data: Mapping[str, object],
+    fonts_data: Mapping[str, object] | None,
+    overrides_qss: str,
+    preview_path: Path | None,
+    is_builtin: bool = False,
+) -> ThemePackage:
+    """Validate already-read theme file contents into a package."""
+    manifest = _parse_manifest(manifest_data, theme_dir)
+    tokens = _parse_tokens(tokens_data, theme_dir)
+    fonts = _parse_fonts(fonts_data, theme_dir) if fonts_data is not None else {}
+
+    if len(overrides_qss.encode("utf-8")) > _MAX_OVERRIDES_BYTES:
+        raise ThemeValidationError(
+            f"{theme_dir / 'overrides.qss'}: file exceeds max size ({_MAX_OVERRIDES_BYTES} bytes)"
+        )
+    if _BLOCKED_OVERRIDES_RE.search(overrides_qss):
+        raise ThemeValidationError(
+            f"{theme_dir}: overrides.qss may not contain @import or url(...) directives"
+        )
 
     return ThemePackage(
         manifest=manifest,
@@ -2,22 +2,44 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
+import time
 
-from musicorg.ui.themes.loader import load_theme_package
-from musicorg.ui.themes.models import ThemePackage, ThemeSummary, ThemeValidationError
+from musicorg import __version__
+from musicorg.ui.themes.loader import build_theme_package, load_theme_package
+from musicorg.ui.themes.models import (
+    ThemePackage,
+    ThemeSummary,
+    ThemeValidationError,
+)
 
 _MAX_THEME_DIR_CANDIDATES = 512
+# Cached file contents are only reused by the build that wrote them.
+_CACHE_FORMAT = f"2:{__version__}"
+# A file modified this close to the cache write could change again without
+# its (mtime, size) moving (coarse timestamps, e.g. 2 s on FAT), so such a
+# theme is not cached until it has settled.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
 
 
 class ThemeRegistry:
     """Loads theme packages from builtin and user directories."""
 
-    def __init__(self, builtin_root: Path, user_root: Path) -> None:
+    def __init__(
+        self,
+        builtin_root: Path,
+        user_root: Path,
+        cache_path: Path | None = None,
+    ) -> None:
         self._builtin_root = builtin_root
         self._user_root = user_root
+        self._cache_path = cache_path
         self._themes: dict[str, ThemePackage] = {}
         self._load_errors: list[str] = []
+        self._cached_entries: dict[str, dict] = {}
+        self._fresh_entries: dict[str, dict] = {}
 
     @property
     def builtin_root(self) -> Path:
@@ -33,8 +55,14 @@ class ThemeRegistry:
     def reload(self) -> None:
         self._themes = {}
         self._load_errors = []
+        self._cached_entries = self._read_cache()
+        self._fresh_entries = {}
         self._load_from_root(self._builtin_root, is_builtin=True, can_override=False)
         self._load_from_root(self._user_root, is_builtin=False, can_override=True)
+        if self._fresh_entries != self._cached_entries:
+            self._write_cache(self._fresh_entries)
+        self._cached_entries = {}
+        self._fresh_entries = {}
 
     def list_themes(self) -> list[ThemeSummary]:
         rows = [
@@ -59,20 +87,24 @@ class ThemeRegistry:
         return list(self._load_errors)
 
     def _load_from_root(self, root: Path, *, is_builtin: bool, can_override: bool) -> None:
-        if not root.exists():
-            return
         try:
-            all_dirs = sorted(path for path in root.iterdir() if path.is_dir())
+            with os.scandir(root) as entries:
+                all_dirs = sorted(
+                    (entry for entry in entries if entry.is_dir()),
+                    key=lambda entry: os.path.normcase(entry.name),
+                )
+        except FileNotFoundError:
+            return
         except OSError as exc:
             self._load_errors.append(f"Failed to list themes in {root}: {exc}")
             return
 
         candidates: list[Path] = []
-        for path in all_dirs:
-            if path.is_symlink():
-                self._load_errors.append(f"Skipping symlink theme directory: {path}")
+        for entry in all_dirs:
+            if entry.is_symlink():
+                self._load_errors.append(f"Skipping symlink theme directory: {entry.path}")
                 continue
-            candidates.append(path)
+            candidates.append(Path(entry.path))
         if len(candidates) > _MAX_THEME_DIR_CANDIDATES:
             self._load_errors.append(
                 f"Theme directory limit exceeded in {root}; "
@@ -82,7 +114,7 @@ class ThemeRegistry:
 
         for theme_dir in candidates:
             try:
-                package = load_theme_package(theme_dir, is_builtin=is_builtin)
+                package = self._load_package(theme_dir, is_builtin=is_builtin)
             except ThemeValidationError as exc:
                 self._load_errors.append(str(exc))
                 continue
@@ -99,3 +131,103 @@ class ThemeRegistry:
                     f"User theme {theme_id!r} overrides built-in theme."
                 )
             self._themes[theme_id] = package
+
+    def _load_package(self, theme_dir: Path, *, is_builtin: bool) -> ThemePackage:
+        if self._cache_path is None:
+            return load_theme_package(theme_dir, is_builtin=is_builtin)
+
+        key = str(theme_dir)
+        fingerprint = _theme_fingerprint(theme_dir)
+        entry = self._cached_entries.get(key)
+        if entry is not None and fingerprint is not None and entry.get("fingerprint") == fingerprint:
+            try:
+                # Cached contents go through the same validation as a fresh
+                # load, so an edited cache file cannot bypass it.
+                package = _package_from_json(entry["package"], theme_dir, is_builtin=is_builtin)
+            except (KeyError, TypeError, ValueError, AttributeError, ThemeValidationError):
+                package = None
+            if package is not None:
+                self._fresh_entries[key] = entry
+                return package
+
+        package = load_theme_package(theme_dir, is_builtin=is_builtin)
+        if fingerprint is not None and not _is_racy(fingerprint):
+            self._fresh_entries[key] = {
+                "fingerprint": fingerprint,
+                "package": _package_to_json(package),
+            }
+        return package
+
+    def _read_cache(self) -> dict[str, dict]:
+        if self._cache_path is None:
+            return {}
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != _CACHE_FORMAT:
+            return {}
+        themes = data.get("themes")
+        return themes if isinstance(themes, dict) else {}
+
+    def _write_cache(self, entries: dict[str, dict]) -> None:
+        if self._cache_path is None:
+            return
+        payload = json.dumps({"format": _CACHE_FORMAT, "themes": entries})
+        tmp_path = self._cache_path.with_name(self._cache_path.name + ".tmp")
+        try:
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            pass
+
+
+def _theme_fingerprint(theme_dir: Path) -> list[list[object]] | None:
+    """Return (name, mtime_ns, size) for every file in a theme directory."""
+    try:
+        with os.scandir(theme_dir) as entries:
+            rows = []
+            for entry in entries:
+                stat = entry.stat(follow_symlinks=False)
+                rows.append([entry.name, stat.st_mtime_ns, stat.st_size])
+    except OSError:
+        return None
+    rows.sort()
+    return rows
+
+
+def _is_racy(fingerprint: list[list[object]]) -> bool:
+    newest = max((int(row[1]) for row in fingerprint), default=0)
+    return newest >= time.time_ns() - _RACY_MTIME_WINDOW_NS
+
+
+def _package_to_json(package: ThemePackage) -> dict[str, object]:
+    manifest = package.manifest
+    return {
+        "manifest": {
+            "schema_version": manifest.schema_version,
+            "theme_id": manifest.theme_id,
+            "name": manifest.name,
+            "version": manifest.version,
+            "author": manifest.author,
+            "description": manifest.description,
+            "target_app_min": manifest.target_app_min,
+        },
+        "tokens": package.tokens,
+        "fonts": package.fonts,
+        "overrides_qss": package.overrides_qss,
+        "preview_name": package.preview_path.name if package.preview_path else None,
+    }
+
+
+def _package_from_json(data: dict, theme_dir: Path, *, is_builtin: bool) -> ThemePackage:
+    preview_name = data["preview_name"]
+    return build_theme_package(
+        theme_dir,
+        manifest_data=dict(data["manifest"]),
+        tokens_data=dict(data["tokens"]),
+        fonts_data=dict(data["fonts"]),
+        overrides_qss=str(data["overrides_qss"]),
+        preview_path=theme_dir / str(preview_name) if preview_name else None,
+        is_builtin=is_builtin,
+    )
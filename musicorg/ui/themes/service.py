@@ -53,7 +53,7 @@ class ThemeService(QObject):
         except Exception as exc:  # pragma: no cover - defensive boundary
             return False, f"Could not compile theme {theme_id}: {exc}"
 
-        self._app.setStyleSheet(stylesheet)
+        self._set_stylesheet(stylesheet)
         self._active_theme_id = theme_id
         if persist:
             self._settings.theme_id = theme_id
@@ -74,9 +74,14 @@ class ThemeService(QObject):
             ok, message = self.apply_theme(candidate, persist=True)
             if ok:
                 return True, message
-        self._app.setStyleSheet(build_default_stylesheet())
+        self._set_stylesheet(build_default_stylesheet())
         self._active_theme_id = DEFAULT_THEME_ID
         self._settings.theme_id = DEFAULT_THEME_ID
         self._settings.theme_last_known_good_id = DEFAULT_THEME_ID
         self.theme_changed.emit(DEFAULT_THEME_ID)
         return False, "No valid theme package found; reverted to built-in default stylesheet."
+
+    def _set_stylesheet(self, stylesheet: str) -> None:
+        # setStyleSheet re-polishes every widget even when the text is unchanged.
+        if self._app.styleSheet() != stylesheet:
+            self._app.setStyleSheet(stylesheet)
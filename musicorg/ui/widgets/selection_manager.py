@@ -21,13 +21,7 @@ class SelectionManager(QObject):
         self._order_index: dict[Path, int] = {}
 
     def set_ordered_paths(self, paths: list[Path]) -> None:
-        seen: set[Path] = set()
-        ordered: list[Path] = []
-        for path in paths:
-            if path in seen:
-                continue
-            seen.add(path)
-            ordered.append(path)
+        ordered = list(dict.fromkeys(paths))
         self._ordered_paths = ordered
         self._order_index = {path: index for index, path in enumerate(ordered)}
         if self._anchor is not None and self._anchor not in self._order_index:
@@ -149,10 +143,10 @@ class SelectionManager(QObject):
             in_order = [path for path in self._ordered_paths if path in self._selected]
             extras = sorted(
                 (path for path in self._selected if path not in self._order_index),
-                key=lambda value: str(value),
+                key=str,
             )
             return in_order + extras
-        return sorted(self._selected, key=lambda value: str(value))
+        return sorted(self._selected, key=str)
 
     def select_all(self, paths: list[Path]) -> None:
         self._replace_selection(self._selected | set(paths))
@@ -176,4 +170,4 @@ class SelectionManager(QObject):
             for ordered in self._ordered_paths:
                 if ordered in paths:
                     return ordered
-        return sorted(paths, key=lambda value: str(value))[0]
+        return min(paths, key=str)
@@ -59,6 +59,14 @@ class DuplicateScanWorker(BaseWorker):
             tm = TagManager()
             file_tags: list[tuple[Path, TagData, int]] = []
             cache_entries: list[tuple[Path, int, int, TagData]] = []
+            cached_tags: dict[Path, TagData] = {}
+            if cache:
+                try:
+                    cached_tags = cache.get_many(
+                        (af.path, af.mtime_ns, af.size) for af in audio_files
+                    )
+                except Exception:
+                    cached_tags = {}
 
             for i, af in enumerate(audio_files):
                 if self._is_cancelled:
@@ -67,13 +75,7 @@ class DuplicateScanWorker(BaseWorker):
 
                 self.progress.emit(i + 1, total, f"Reading tags: {af.path.name}")
 
-                tag_data: TagData | None = None
-                if cache:
-                    try:
-                        tag_data = cache.get(af.path, af.mtime_ns, af.size)
-                    except Exception:
-                        tag_data = None
-
+                tag_data = cached_tags.get(af.path)
                 if tag_data is None:
                     try:
                         tag_data = tm.read(af.path)
@@ -15,17 +15,19 @@ class SyncPlanWorker(BaseWorker):
     """Plans a sync operation in a background thread."""
 
     def __init__(self, source_dir: str, dest_dir: str,
-                 path_format: str, include_reverse: bool = False) -> None:
+                 path_format: str, include_reverse: bool = False,
+                 cache_db_path: str = "") -> None:
         super().__init__()
         self._source_dir = source_dir
         self._dest_dir = dest_dir
         self._path_format = path_format
         self._include_reverse = include_reverse
+        self._cache_db_path = cache_db_path
 
     def run(self) -> None:
         self.started.emit()
         try:
-            mgr = SyncManager(self._path_format)
+            mgr = SyncManager(self._path_format, cache_db_path=self._cache_db_path)
             plan = mgr.plan_sync(
                 self._source_dir,
                 self._dest_dir,
@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 from pathlib import Path
+import threading
 
 import pytest
 
-from musicorg.core.autotagger import AutoTagger, MatchCandidate
+from musicorg.core import autotagger as autotagger_module
+from musicorg.core.autotagger import AutoTagger, MatchCandidate, TrackRow
+from musicorg.core.tagger import TagData
+
+
+@pytest.fixture(autouse=True)
+def _clear_search_cache():
+    AutoTagger.clear_search_cache()
+    yield
+    AutoTagger.clear_search_cache()
 
 
 class _Artist:
@@ -20,6 +30,75 @@ class _Release:
         self.artists = [_Artist(name) for name in artists]
 
 
+class _Track:
+    def __init__(self, position: str, title: str, duration: str = "") -> None:
+        self.position = position
+        self.title = title
+        self.duration = duration
+
+
+class _SearchRelease(_Release):
+    def __init__(self, title: str, artists: list[str], tracks: list[_Track]) -> None:
+        super().__init__(title, artists)
+        self.tracklist = tracks
+        self.year = 2000
+        self.id = 42
+        self.genres = ["Rock"]
+        self.styles = ["Alternative"]
+        self.images = []
+
+
+class _FakeDiscogsClient:
+    releases: list[_SearchRelease] = []
+
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def search(self, *args, **kwargs):
+        return iter(self.releases)
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", content_type: str = "") -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = {"Content-Type": content_type} if content_type else {}
+
+    def iter_content(self, chunk_size: int = 1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class _FakeSession:
+    def __init__(self, responses: dict[str, list[_FakeResponse]]) -> None:
+        self._responses = responses
+        self.requested: list[str] = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return self._responses[url].pop(0)
+
+
+class _FakeTagWriter:
+    def __init__(self, existing: dict[str, TagData] | None = None) -> None:
+        self.existing = existing or {}
+        self.reads: list[Path] = []
+        self.written: dict[str, TagData] = {}
+
+    def read(self, path: Path, *, include_artwork: bool = True) -> TagData:
+        self.reads.append(path)
+        return self.existing.get(path.name, TagData())
+
+    def write(self, path: Path, tag_data: TagData) -> None:
+        self.written[Path(path).name] = tag_data
+
+
 class _ReleaseWithImages:
     def __init__(self, images: list[dict[str, str]]) -> None:
         self.images = images
@@ -47,6 +126,11 @@ class TestMatchCandidate:
         assert mc.tracks == []
         assert mc.raw_match is None
 
+    def test_uses_slots(self):
+        mc = MatchCandidate()
+        assert not hasattr(mc, "__dict__")
+        assert MatchCandidate().tracks is not mc.tracks
+
 
 class TestAutoTagger:
     def test_search_album_empty_paths(self):
@@ -58,6 +142,46 @@ class TestAutoTagger:
         fake = tmp_path / "nonexistent.mp3"
         assert at.search_item(fake) == []
 
+    def test_search_item_reads_hints_through_shared_tag_manager(self, tmp_path: Path, monkeypatch):
+        track = tmp_path / "song.mp3"
+        track.write_bytes(b"")
+        at = AutoTagger()
+        writer = _FakeTagWriter({"song.mp3": TagData(artist="Coldplay", title="Yellow")})
+        at._tag_manager = writer
+        seen: list[tuple[str, str]] = []
+        monkeypatch.setattr(at, "_search_item_mb", lambda artist, title: seen.append((artist, title)) or [])
+
+        at.search_item_with_diagnostics(track)
+
+        assert writer.reads == [track]
+        assert seen == [("Coldplay", "Yellow")]
+
+    def test_tag_reads_are_reused_until_the_file_changes(self, tmp_path: Path):
+        track = tmp_path / "01 song.flac"
+        track.write_bytes(b"v1")
+        at = AutoTagger()
+        writer = _FakeTagWriter(
+            {"01 song.flac": TagData(albumartist="Artist", album="Album", artwork_data=b"img")}
+        )
+        at._tag_manager = writer
+
+        assert at._resolve_hints_from_files([track], "", "") == ("Artist", "Album")
+        assert at._resolve_hints_from_files([track], "", "") == ("Artist", "Album")
+        assert len(writer.reads) == 1
+
+        track.write_bytes(b"v2 rewritten")
+        at._resolve_hints_from_files([track], "", "")
+        assert len(writer.reads) == 2
+
+    def test_apply_match_without_tracks_skips_artwork_download(self, monkeypatch):
+        def _download(urls):
+            raise AssertionError("artwork should not be fetched")
+
+        monkeypatch.setattr(AutoTagger, "_download_artwork_from_urls", staticmethod(_download))
+        match = MatchCandidate(raw_match={"tracks": [], "artwork_urls": ["https://example.com/a.jpg"]})
+
+        assert AutoTagger().apply_match(["01 a.flac"], match) is False
+
     def test_apply_match_no_raw(self):
         at = AutoTagger()
         mc = MatchCandidate(raw_match=None)
@@ -89,6 +213,71 @@ class TestAutoTagger:
         assert at._mb_extract_year({"first-release-date": "1999"}) == 1999
         assert at._mb_extract_year({"date": ""}) == 0
 
+    def test_search_album_mb_fetches_release_details(self, monkeypatch):
+        import musicbrainzngs
+
+        rid_a = "9e0f52d6-87b2-4f57-8df2-d86f0416533a"
+        rid_b = "2d0f52d6-87b2-4f57-8df2-d86f0416533a"
+        looked_up: list[str] = []
+
+        def _get_release_by_id(release_id, includes):
+            looked_up.append(release_id)
+            return {
+                "release": {
+                    "title": f"Full {release_id[:4]}",
+                    "date": "2000-07-10",
+                    "artist-credit-phrase": "Coldplay",
+                    "medium-list": [
+                        {"position": "1", "track-list": [
+                            {"number": "1", "recording": {"title": "Yellow", "length": "269000"}},
+                        ]},
+                    ],
+                }
+            }
+
+        monkeypatch.setattr(
+            musicbrainzngs,
+            "search_releases",
+            lambda **query: {
+                "release-list": [
+                    {"id": rid_a, "ext:score": "100"},
+                    {"id": "not-a-uuid", "title": "Bare", "ext:score": "50"},
+                    {"id": rid_b, "ext:score": "90"},
+                ]
+            },
+        )
+        monkeypatch.setattr(musicbrainzngs, "get_release_by_id", _get_release_by_id)
+
+        candidates = AutoTagger()._search_album_mb("Coldplay", "Parachutes")
+
+        assert [c.album for c in candidates] == ["Full 9e0f", "Bare", "Full 2d0f"]
+        assert sorted(looked_up) == sorted([rid_a, rid_b])
+        assert candidates[0].tracks[0].title == "Yellow"
+        assert candidates[0].tracks[0].length == 269
+        assert candidates[0].year == 2000
+
+    def test_mb_release_details_are_cached_by_release_id(self, monkeypatch):
+        import musicbrainzngs
+
+        rid = "9e0f52d6-87b2-4f57-8df2-d86f0416533a"
+        calls: list[str] = []
+        responses = [RuntimeError("503"), {"release": {"id": rid, "title": "Parachutes"}}]
+
+        def _get_release_by_id(release_id, includes):
+            calls.append(release_id)
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(musicbrainzngs, "get_release_by_id", _get_release_by_id)
+
+        at = AutoTagger()
+        assert at._mb_release_details(rid) is None
+        assert at._mb_release_details(rid)["title"] == "Parachutes"
+        assert AutoTagger()._mb_release_details(rid)["title"] == "Parachutes"
+        assert calls == [rid, rid]
+
     def test_mb_artwork_urls(self):
         at = AutoTagger()
         rid = "9e0f52d6-87b2-4f57-8df2-d86f0416533a"
@@ -132,12 +321,234 @@ class TestAutoTagger:
         assert 0.0 <= far_score <= 1.0
         assert close_score < far_score
 
+    def test_discogs_distance_exact_match_is_zero(self):
+        at = AutoTagger()
+        release = _Release("Parachutes", ["Coldplay"])
+
+        assert at._discogs_distance(" coldplay ", "PARACHUTES", release) == 0.0
+
+    def test_discogs_distance_without_rapidfuzz(self, monkeypatch):
+        monkeypatch.setattr(autotagger_module, "_rapidfuzz_fuzz", None)
+        at = AutoTagger()
+        close = _Release("The Dark Side of the Moon", ["Pink Floyd"])
+        far = _Release("Random Comp", ["Unknown Artist"])
+
+        close_score = at._discogs_distance("Pink Floyd", "Dark Side of the Moon", close)
+        far_score = at._discogs_distance("Pink Floyd", "Dark Side of the Moon", far)
+
+        assert close_score < far_score
+
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    def test_search_item_discogs_picks_best_track(self, monkeypatch, use_rapidfuzz):
+        import discogs_client
+
+        if not use_rapidfuzz:
+            monkeypatch.setattr(autotagger_module, "_rapidfuzz_fuzz", None)
+            monkeypatch.setattr(autotagger_module, "_rapidfuzz_process", None)
+        monkeypatch.setattr(discogs_client, "Client", _FakeDiscogsClient)
+        monkeypatch.setattr(
+            _FakeDiscogsClient,
+            "releases",
+            [
+                _SearchRelease("Nothing Here", ["Someone"], [_Track("1", "Completely Different")]),
+                _SearchRelease(
+                    "Parachutes",
+                    ["Coldplay"],
+                    [_Track("1", "Don't Panic"), _Track("A5", "Yellow", "4:29"), _Track("6", "")],
+                ),
+            ],
+        )
+
+        candidates = AutoTagger(discogs_token="token")._search_item_discogs("Coldplay", "Yellow")
+
+        assert len(candidates) == 1
+        match = candidates[0].raw_match
+        assert match["title"] == "Yellow"
+        assert (match["disc"], match["track"]) == (1, 5)
+        assert match["length"] == 269
+        assert match["genre"] == "Rock, Alternative"
+        assert candidates[0].distance < 0.2
+
+    def test_apply_album_match_orders_tracks_by_disc_and_number(self):
+        writer = _FakeTagWriter(
+            {
+                "a.flac": TagData(disc=2, track=1),
+                "b.flac": TagData(disc=1, track=2),
+                "c.flac": TagData(disc=1, track=1),
+            }
+        )
+        payload = {
+            "artist": "Artist",
+            "album": "Album",
+            "tracks": [
+                TrackRow(track=1, disc=2, title="Disc Two", artist="Artist", length=0),
+                TrackRow(track=2, disc=1, title="Second", artist="Guest", length=0),
+                TrackRow(track=1, disc=1, title="First", artist="Artist", length=0),
+            ],
+        }
+
+        applied = AutoTagger()._apply_album_match(
+            writer, ["a.flac", "b.flac", "c.flac"], payload, None, ""
+        )
+
+        assert applied
+        titles = {name: (tags.title, tags.disc, tags.track) for name, tags in writer.written.items()}
+        assert titles == {
+            "a.flac": ("Disc Two", 2, 1),
+            "b.flac": ("Second", 1, 2),
+            "c.flac": ("First", 1, 1),
+        }
+        assert writer.written["b.flac"].artist == "Guest"
+
+    def test_apply_album_match_orders_numbered_files_without_reading_tags(self):
+        writer = _FakeTagWriter()
+        payload = {
+            "tracks": [
+                TrackRow(track=2, disc=1, title="Second", artist="", length=0),
+                TrackRow(track=1, disc=2, title="Disc Two", artist="", length=0),
+                TrackRow(track=1, disc=1, title="First", artist="", length=0),
+            ],
+        }
+
+        AutoTagger()._apply_album_match(
+            writer, ["2-01 Song.flac", "02 Song.flac", "01 Song.flac"], payload, None, ""
+        )
+
+        assert writer.reads == []
+        assert writer.written["01 Song.flac"].title == "First"
+        assert writer.written["02 Song.flac"].title == "Second"
+        assert writer.written["2-01 Song.flac"].title == "Disc Two"
+
+    def test_apply_album_match_trusts_tags_over_numeric_titles(self):
+        writer = _FakeTagWriter(
+            {
+                "99 Luftballons.flac": TagData(track=1),
+                "1979.flac": TagData(track=3),
+                "2-4-6-8 Motorway.flac": TagData(track=2),
+            }
+        )
+        payload = {
+            "tracks": [
+                TrackRow(track=1, disc=1, title="One", artist="", length=0),
+                TrackRow(track=2, disc=1, title="Two", artist="", length=0),
+                TrackRow(track=3, disc=1, title="Three", artist="", length=0),
+            ],
+        }
+        paths = ["99 Luftballons.flac", "1979.flac", "2-4-6-8 Motorway.flac"]
+
+        AutoTagger()._apply_album_match(writer, paths, payload, None, "")
+
+        assert len(writer.reads) == 3
+        assert {name: tags.title for name, tags in writer.written.items()} == {
+            "99 Luftballons.flac": "One",
+            "2-4-6-8 Motorway.flac": "Two",
+            "1979.flac": "Three",
+        }
+
+    def test_apply_album_match_uses_name_position_when_tags_lack_track(self):
+        writer = _FakeTagWriter()
+        payload = {
+            "tracks": [
+                TrackRow(track=1, disc=1, title="One", artist="", length=0),
+                TrackRow(track=2, disc=1, title="Two", artist="", length=0),
+                TrackRow(track=3, disc=1, title="Three", artist="", length=0),
+            ],
+        }
+
+        AutoTagger()._apply_album_match(
+            writer, ["02 b.flac", "01 a.flac", "zz.flac"], payload, None, ""
+        )
+
+        # "zz" has no position anywhere, so the names cannot be trusted alone.
+        assert len(writer.reads) == 3
+        assert {name: tags.title for name, tags in writer.written.items()} == {
+            "01 a.flac": "One",
+            "02 b.flac": "Two",
+            "zz.flac": "Three",
+        }
+
+    def test_apply_album_match_writes_files_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _BarrierWriter(_FakeTagWriter):
+            def write(self, path, tag_data):
+                barrier.wait()
+                super().write(path, tag_data)
+
+        writer = _BarrierWriter()
+        payload = {
+            "tracks": [
+                TrackRow(track=1, disc=1, title="One", artist="", length=0),
+                TrackRow(track=2, disc=1, title="Two", artist="", length=0),
+            ],
+        }
+
+        AutoTagger()._apply_album_match(writer, ["01 a.flac", "02 b.flac"], payload, None, "")
+
+        assert sorted(writer.written) == ["01 a.flac", "02 b.flac"]
+
+    def test_write_tags_stops_queued_writes_after_first_failure(self, monkeypatch):
+        monkeypatch.setattr(autotagger_module, "_TAG_WRITE_WORKERS", 1)
+        slow_write = threading.Event()
+
+        class _FailingWriter(_FakeTagWriter):
+            def write(self, path, tag_data):
+                if path == "01.flac":
+                    raise OSError("disk full")
+                # Keep the one started write busy while the failure is handled.
+                slow_write.wait(timeout=0.5)
+                super().write(path, tag_data)
+
+        writer = _FailingWriter()
+        writes = [(f"0{index}.flac", TagData()) for index in range(1, 6)]
+
+        with pytest.raises(OSError, match="disk full"):
+            AutoTagger._write_tags(writer, writes)
+
+        # Only the write already running when the failure arrived completes.
+        assert set(writer.written) <= {"02.flac"}
+
+    def test_apply_album_match_reads_tags_when_names_are_ambiguous(self):
+        writer = _FakeTagWriter()
+        payload = {"tracks": [TrackRow(track=1, disc=1, title="Only", artist="", length=0)] * 2}
+
+        AutoTagger()._apply_album_match(writer, ["01 a.flac", "01 b.flac"], payload, None, "")
+
+        assert [path.name for path in writer.reads] == ["01 a.flac", "01 b.flac"]
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("urlopen error [WinError 10054] An existing connection was forcibly closed", True),
+            ("HTTP Error  503: Service Unavailable", True),
+            ("Remote end\nclosed connection without response", True),
+            ("Read TIMEOUT", True),
+            ("HTTP Error 404: Not Found", False),
+        ],
+    )
+    def test_is_transient_network_error(self, message, expected):
+        assert AutoTagger._is_transient_network_error(RuntimeError(message)) is expected
+
+    def test_retry_delay_grows_exponentially_with_bounded_jitter(self):
+        for attempt, (low, high) in enumerate([(0.175, 0.35), (0.35, 0.7), (0.7, 1.4), (1.0, 2.0), (1.0, 2.0)]):
+            delays = [autotagger_module._retry_delay(attempt) for _ in range(50)]
+            assert all(low <= delay <= high for delay in delays)
+
     def test_parse_duration(self):
         at = AutoTagger()
         assert at._parse_duration("3:45") == 225
         assert at._parse_duration("1:02:03") == 3723
         assert at._parse_duration("") == 0
         assert at._parse_duration("bad") == 0
+        assert at._parse_duration("3:4\u00b2") == 0
+
+    def test_length_ms_to_secs(self):
+        at = AutoTagger()
+        assert at._length_ms_to_secs("269000") == 269
+        assert at._length_ms_to_secs(269999) == 269
+        assert at._length_ms_to_secs(None) == 0
+        assert at._length_ms_to_secs("n/a") == 0
+        assert at._length_ms_to_secs("-5000") == 0
 
     def test_parse_discogs_position(self):
         at = AutoTagger()
@@ -205,6 +616,97 @@ class TestAutoTagger:
         assert "MusicBrainz" in payload["source_errors"]
         assert "timeout" in payload["source_errors"]["MusicBrainz"]
 
+    def test_search_album_with_diagnostics_queries_sources_concurrently(self, monkeypatch):
+        at = AutoTagger(discogs_token="token")
+        both_started = threading.Barrier(2, timeout=5)
+        mb_candidate = MatchCandidate(source="MusicBrainz", album="Parachutes", distance=0.3)
+        discogs_candidate = MatchCandidate(source="Discogs", album="Parachutes", distance=0.1)
+
+        def _search(candidate):
+            def _run(artist, album):
+                both_started.wait()
+                return [candidate]
+            return _run
+
+        monkeypatch.setattr(
+            at,
+            "_resolve_hints_from_files",
+            lambda paths, artist_hint, album_hint: ("Coldplay", "Parachutes"),
+        )
+        monkeypatch.setattr(at, "_search_album_mb", _search(mb_candidate))
+        monkeypatch.setattr(at, "_search_album_discogs", _search(discogs_candidate))
+
+        payload = at.search_album_with_diagnostics(["dummy.mp3"])
+        assert payload["candidates"] == [discogs_candidate, mb_candidate]
+        assert payload["source_errors"] == {}
+
+    def test_provider_searches_are_memoized_across_instances(self, monkeypatch):
+        import discogs_client
+
+        searches = {"count": 0}
+
+        class _CountingClient(_FakeDiscogsClient):
+            def search(self, *args, **kwargs):
+                searches["count"] += 1
+                return super().search(*args, **kwargs)
+
+        monkeypatch.setattr(discogs_client, "Client", _CountingClient)
+        monkeypatch.setattr(
+            _FakeDiscogsClient,
+            "releases",
+            [_SearchRelease("Parachutes", ["Coldplay"], [_Track("5", "Yellow")])],
+        )
+
+        first = AutoTagger(discogs_token="token")._search_item_discogs("Coldplay", "Yellow")
+        second = AutoTagger(discogs_token="token")._search_item_discogs("Coldplay", "Yellow")
+        AutoTagger(discogs_token="other")._search_item_discogs("Coldplay", "Yellow")
+
+        assert second == first
+        assert second is not first
+        assert searches["count"] == 2
+
+    def test_memoized_search_results_are_not_shared_between_callers(self, monkeypatch):
+        import discogs_client
+
+        monkeypatch.setattr(discogs_client, "Client", _FakeDiscogsClient)
+        monkeypatch.setattr(
+            _FakeDiscogsClient,
+            "releases",
+            [_SearchRelease("Parachutes", ["Coldplay"], [_Track("5", "Yellow")])],
+        )
+
+        first = AutoTagger(discogs_token="token")._search_item_discogs("Coldplay", "Yellow")
+        first[0].tracks.clear()
+        first[0].raw_match["title"] = "Edited"
+
+        second = AutoTagger(discogs_token="token")._search_item_discogs("Coldplay", "Yellow")
+        second[0].album = "Edited too"
+        third = AutoTagger(discogs_token="token")._search_item_discogs("Coldplay", "Yellow")
+
+        assert second[0].tracks
+        assert second[0].raw_match["title"] == "Yellow"
+        assert third[0].album == "Parachutes"
+
+    def test_memoized_search_expires_after_ttl(self, monkeypatch):
+        import discogs_client
+
+        now = {"value": 1000.0}
+        monkeypatch.setattr(autotagger_module.time, "monotonic", lambda: now["value"])
+        monkeypatch.setattr(discogs_client, "Client", _FakeDiscogsClient)
+        monkeypatch.setattr(
+            _FakeDiscogsClient,
+            "releases",
+            [_SearchRelease("Parachutes", ["Coldplay"], [_Track("5", "Yellow")])],
+        )
+        at = AutoTagger(discogs_token="token")
+        at._search_item_discogs("Coldplay", "Yellow")
+
+        monkeypatch.setattr(_FakeDiscogsClient, "releases", [])
+        assert len(at._search_item_discogs("Coldplay", "Yellow")) == 1
+
+        now["value"] += autotagger_module._SEARCH_CACHE_TTL + 1
+        assert at._search_item_discogs("Coldplay", "Yellow") == []
+
     def test_search_album_with_diagnostics_raises_when_all_sources_fail(self, monkeypatch):
         at = AutoTagger()
 
@@ -246,7 +748,136 @@ class TestAutoTagger:
         assert payload["source_errors"] == {}
         assert attempts["count"] == 2
 
+    def test_http_session_retries_transient_statuses_in_adapter(self):
+        adapter = autotagger_module._http_session().get_adapter("https://coverartarchive.org/")
+        retry = adapter.max_retries
+
+        assert set(retry.status_forcelist) == {429, 502, 503, 504}
+        assert retry.total == 2
+        assert not retry.raise_on_status
+
+    def test_download_artwork_falls_back_after_error_status(self, monkeypatch):
+        base = "https://coverartarchive.org/release/abc"
+        session = _FakeSession(
+            {
+                f"{base}/front-500": [_FakeResponse(503)],
+                f"{base}/front": [_FakeResponse(200, b"\x89PNG\r\n\x1a\nimage")],
+            }
+        )
+        monkeypatch.setattr(autotagger_module, "_http_session", lambda: session)
+
+        artwork = AutoTagger._download_artwork_from_urls([f"{base}/front-500"])
+
+        assert artwork == (b"\x89PNG\r\n\x1a\nimage", "image/png")
+        assert session.requested == [f"{base}/front-500", f"{base}/front"]
+
+    def test_download_artwork_reuses_cached_response_unless_no_store(self, monkeypatch):
+        cached_url = "https://img.discogs.com/cached.jpg"
+        uncached_url = "https://img.discogs.com/uncached.jpg"
+        jpeg = _FakeResponse(200, b"\xFF\xD8\xFFjpeg", "image/jpeg")
+        no_store = _FakeResponse(200, b"\xFF\xD8\xFFjpeg", "image/jpeg")
+        no_store.headers["Cache-Control"] = "no-store"
+        session = _FakeSession({cached_url: [jpeg], uncached_url: [no_store, no_store]})
+        monkeypatch.setattr(autotagger_module, "_http_session", lambda: session)
+
+        for _ in range(2):
+            assert AutoTagger._download_artwork_from_urls([cached_url]) is not None
+            assert AutoTagger._download_artwork_from_urls([uncached_url]) is not None
+
+        assert session.requested == [cached_url, uncached_url, uncached_url]
+
+    def test_download_artwork_skips_html_served_as_image(self, monkeypatch):
+        base = "https://coverartarchive.org/release/abc"
+        session = _FakeSession(
+            {
+                f"{base}/front-500": [_FakeResponse(200, b"<!DOCTYPE html><p>busy</p>", "image/jpeg")],
+                f"{base}/front": [_FakeResponse(200, b"\xFF\xD8\xFFjpeg", "image/jpeg")],
+            }
+        )
+        monkeypatch.setattr(autotagger_module, "_http_session", lambda: session)
+
+        artwork = AutoTagger._download_artwork_from_urls([f"{base}/front-500"])
+
+        assert artwork == (b"\xFF\xD8\xFFjpeg", "image/jpeg")
+
+    def test_artwork_body_stops_reading_once_html_is_detected(self, monkeypatch):
+        monkeypatch.setattr(autotagger_module, "_ARTWORK_CHUNK_SIZE", 256)
+        page = _FakeResponse(200, b"<html>" + b" " * 250 + b"<body>" * 1000, "image/jpeg")
+        consumed: list[bytes] = []
+        chunks = page.iter_content
+
+        def tracking_iter_content(chunk_size=1):
+            for chunk in chunks(chunk_size):
+                consumed.append(chunk)
+                yield chunk
+
+        page.iter_content = tracking_iter_content
+
+        assert AutoTagger._read_artwork_body(page, 1 << 20) is None
+        assert len(consumed) == 1
+
+    def test_download_artwork_rejects_oversized_payloads(self, monkeypatch):
+        declared_url = "https://img.discogs.com/declared.jpg"
+        streamed_url = "https://img.discogs.com/streamed.jpg"
+        declared = _FakeResponse(200, b"\xFF\xD8\xFFjpeg", "image/jpeg")
+        declared.headers["Content-Length"] = "64"
+        session = _FakeSession(
+            {
+                declared_url: [declared],
+                streamed_url: [_FakeResponse(200, b"\xFF\xD8\xFF" + b"x" * 40, "image/jpeg")],
+            }
+        )
+        monkeypatch.setattr(autotagger_module, "_http_session", lambda: session)
+        monkeypatch.setattr(autotagger_module, "MAX_ARTWORK_BYTES", 32)
+        monkeypatch.setattr(autotagger_module, "_ARTWORK_CHUNK_SIZE", 8)
+
+        assert AutoTagger._fetch_artwork(declared_url) is None
+        assert AutoTagger._fetch_artwork(streamed_url) is None
+
+    def test_ttl_cache_evicts_by_weight(self):
+        cache = autotagger_module._TTLCache(maxsize=10, ttl=60, weigh=len, max_weight=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+        cache.set("huge", b"x" * 11)
+
+        assert cache.get("a") == b"1234"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"1234"
+        assert cache.get("huge") is None
+
+    def test_download_artwork_hedges_past_a_stalled_url(self, monkeypatch):
+        base = "https://coverartarchive.org/release/abc"
+        release_stalled = threading.Event()
+
+        class _StallingSession(_FakeSession):
+            def get(self, url, **kwargs):
+                if url.endswith("front-500"):
+                    release_stalled.wait(5)
+                    return _FakeResponse(404)
+                return super().get(url, **kwargs)
+
+        session = _StallingSession({f"{base}/front": [_FakeResponse(200, b"\xFF\xD8\xFFjpeg")]})
+        monkeypatch.setattr(autotagger_module, "_http_session", lambda: session)
+        monkeypatch.setattr(autotagger_module, "_ARTWORK_HEDGE_DELAY", 0.01)
+
+        try:
+            artwork = AutoTagger._download_artwork_from_urls([f"{base}/front-500"])
+        finally:
+            release_stalled.set()
+
+        assert artwork == (b"\xFF\xD8\xFFjpeg", "image/jpeg")
+
+    def test_normalize_content_type(self):
+        assert AutoTagger._normalize_content_type("Image/JPEG; charset=binary") == "image/jpeg"
+        assert AutoTagger._normalize_content_type("text/html; charset=UTF-8") == ""
+        assert AutoTagger._normalize_content_type("") == ""
+
     def test_guess_image_mime(self):
         at = AutoTagger()
         assert at._guess_image_mime(b"\xFF\xD8\xFFtest") == "image/jpeg"
         assert at._guess_image_mime(b"\x89PNG\r\n\x1a\n123") == "image/png"
+        assert at._guess_image_mime(b"RIFF\x10\x00\x00\x00WEBPVP8 ") == "image/webp"
+        assert at._guess_image_mime(b"GIF89a...") == "image/gif"
+        assert at._guess_image_mime(b"RIFF\x10\x00\x00\x00WAVEfmt ") == ""
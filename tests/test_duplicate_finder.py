@@ -77,6 +77,24 @@ class TestFindDuplicates:
         ]
         assert len(find_duplicates(files)) == 1
 
+    def test_groups_and_files_use_slots(self):
+        files = [
+            (Path("a.mp3"), _tag("Song"), 1000),
+            (Path("b.flac"), _tag("Song"), 2000),
+        ]
+        group = find_duplicates(files)[0]
+        assert not hasattr(group, "__dict__")
+        assert not hasattr(group.files[0], "__dict__")
+
+    def test_group_key_is_joined_label(self):
+        files = [
+            (Path("a.mp3"), _tag("Song", "Artist", "Album A"), 1000),
+            (Path("b.flac"), _tag("Song", "Artist", "Album A"), 2000),
+        ]
+        assert find_duplicates(files)[0].normalized_key == "song || album a"
+        groups = find_duplicates(files, match_artist=True)
+        assert groups[0].normalized_key == "song || album a || artist"
+
     def test_match_artist_prevents_cross_artist_grouping(self):
         files = [
             (Path("a.mp3"), _tag("Song", "Artist A", "Same Album"), 1000),
@@ -1,5 +1,6 @@
 """Tests for musicorg.core.scanner."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -70,6 +71,58 @@ class TestFileScanner:
         results = list(scanner.scan_iter())
         assert len(results) == 3
 
+    def test_scan_nested_dirs_sorted_with_stat(self, tmp_path):
+        for name in ("b", "a/deep", "c"):
+            (tmp_path / name).mkdir(parents=True)
+            (tmp_path / name / "track.mp3").write_bytes(b"\x00" * 64)
+        results = FileScanner(tmp_path).scan()
+        assert len(results) == 3
+        assert all(af.size == 64 and af.extension == ".mp3" for af in results)
+        assert results[0].mtime_ns == AudioFile(path=results[0].path).mtime_ns
+
+    def test_scan_iter_streams_depth_first(self, tmp_path):
+        for name in ("b", "a/deep", "a"):
+            (tmp_path / name).mkdir(parents=True, exist_ok=True)
+        for rel in ("top.mp3", "a/1.mp3", "a/deep/2.mp3", "b/3.mp3"):
+            (tmp_path / rel).write_bytes(b"\x00")
+
+        names = [af.path.relative_to(tmp_path).as_posix() for af in FileScanner(tmp_path).scan_iter()]
+
+        assert names[0] == "top.mp3"
+        assert names.index("a/1.mp3") < names.index("a/deep/2.mp3")
+        assert sorted(names) == ["a/1.mp3", "a/deep/2.mp3", "b/3.mp3", "top.mp3"]
+
+    def test_scan_order_matches_sorted_top_down_walk(self, tmp_path):
+        for rel in ("z.mp3", "a.mp3", "a/2.mp3", "a/1.mp3", "a/b/0.mp3", "a_b/0.mp3", "b/0.mp3"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_bytes(b"\x00")
+        (tmp_path / "a.mp3").rename(tmp_path / "A.mp3")
+
+        expected = []
+        for dirpath, dirnames, filenames in os.walk(tmp_path):
+            dirnames.sort()
+            expected.extend(Path(dirpath) / name for name in sorted(filenames))
+        scanner = FileScanner(tmp_path)
+
+        assert [af.path for af in scanner.scan()] == expected
+        assert [af.path for af in scanner.scan_iter()] == expected
+        assert [p.relative_to(tmp_path).as_posix() for p in expected] == [
+            "A.mp3", "z.mp3", "a/1.mp3", "a/2.mp3", "a/b/0.mp3", "a_b/0.mp3", "b/0.mp3",
+        ]
+
+    def test_scan_flat_dir_does_not_start_threads(self, audio_dir, monkeypatch):
+        (audio_dir / "subdir" / "song3.mp3").unlink()
+        (audio_dir / "subdir").rmdir()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("a flat directory should be listed inline")
+
+        monkeypatch.setattr("musicorg.core.scanner.ThreadPoolExecutor", fail)
+        assert [af.path.name for af in FileScanner(audio_dir).scan()] == ["song1.mp3", "song2.flac"]
+
+    def test_scan_missing_root(self, tmp_path):
+        assert FileScanner(tmp_path / "missing").scan() == []
+
     def test_audio_extensions(self):
         assert ".mp3" in AUDIO_EXTENSIONS
         assert ".flac" in AUDIO_EXTENSIONS
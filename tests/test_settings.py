@@ -0,0 +1,151 @@
+"""Tests for musicorg.config.settings."""
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QSettings
+
+from musicorg.config import settings as settings_module
+from musicorg.config.settings import AppSettings
+
+
+@pytest.fixture
+def app_settings(tmp_path, monkeypatch):
+    # A per-test INI file instead of QSettings.setPath, which is process-wide
+    # and would leak into every later test.
+    ini_path = str(tmp_path / "qsettings" / "MusicOrg.ini")
+    monkeypatch.setattr(
+        settings_module,
+        "QSettings",
+        lambda _org, _app: QSettings(ini_path, QSettings.Format.IniFormat),
+    )
+    monkeypatch.setattr(settings_module, "_APP_DATA_ROOT", tmp_path / "appdata" / "musicorg")
+    return AppSettings()
+
+
+def test_app_data_dir_created_once(app_settings, tmp_path, monkeypatch):
+    first = app_settings.app_data_dir
+    assert first == tmp_path / "appdata" / "musicorg"
+    assert first.is_dir()
+
+    def fail_mkdir(self, *args, **kwargs):
+        raise AssertionError(f"unexpected mkdir for {self}")
+
+    monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+
+    assert app_settings.app_data_dir == first
+
+
+def test_themes_dir_follows_custom_dir(app_settings, tmp_path):
+    assert app_settings.themes_dir == tmp_path / "appdata" / "musicorg" / "themes"
+
+    custom = tmp_path / "custom-themes"
+    app_settings.theme_custom_dir = str(custom)
+
+    assert app_settings.themes_dir == custom
+    assert custom.is_dir()
+
+
+def test_values_are_not_read_from_backend_per_access(app_settings, monkeypatch):
+    app_settings.source_dir = "/music/in"
+    reads: list[str] = []
+    original_value = app_settings._qs.value
+
+    def counting_value(key, *args, **kwargs):
+        reads.append(key)
+        return original_value(key, *args, **kwargs)
+
+    monkeypatch.setattr(app_settings, "_qs", _QSettingsProxy(app_settings._qs, counting_value))
+
+    assert app_settings.source_dir == "/music/in"
+    assert app_settings.source_dir == "/music/in"
+    assert app_settings.dest_dir == ""
+    assert reads == []
+
+    app_settings.source_dir = "/music/other"
+    assert app_settings.source_dir == "/music/other"
+
+
+def test_snapshot_coerces_persisted_values(app_settings):
+    app_settings.backdrop_opacity = 0.25
+    app_settings.source_dir = "/music/in"
+    app_settings._qs.sync()
+
+    reloaded = AppSettings()
+
+    assert reloaded.backdrop_opacity == pytest.approx(0.25)
+    assert reloaded.source_dir == "/music/in"
+    assert reloaded.path_format == "$albumartist/$album/$track $title"
+
+
+class _QSettingsProxy:
+    def __init__(self, qs: QSettings, value, set_value=None) -> None:
+        self._qs = qs
+        self.value = value
+        if set_value is not None:
+            self.setValue = set_value
+
+    def __getattr__(self, name):
+        return getattr(self._qs, name)
+
+
+def test_instance_is_shared(app_settings, monkeypatch):
+    monkeypatch.setattr(AppSettings, "_instance", None)
+
+    first = AppSettings.instance()
+
+    assert AppSettings.instance() is first
+
+
+def test_tag_cache_db_path_in_app_data_dir(app_settings, tmp_path):
+    expected = str(tmp_path / "appdata" / "musicorg" / "tag_cache.db")
+
+    assert app_settings.tag_cache_db_path == expected
+    assert app_settings.tag_cache_db_path is app_settings.tag_cache_db_path
+
+
+def test_existing_dir_is_not_recreated(app_settings, tmp_path, monkeypatch):
+    existing = tmp_path / "appdata" / "musicorg"
+    existing.mkdir(parents=True)
+
+    def fail_mkdir(self, *args, **kwargs):
+        raise AssertionError(f"unexpected mkdir for {self}")
+
+    monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+
+    assert app_settings.app_data_dir == existing
+
+
+def test_keybind_overrides_drop_non_string_entries(app_settings):
+    app_settings.keybind_overrides = {"a.one": "Ctrl+1", "a.two": 2, 3: "Ctrl+3"}
+
+    assert app_settings.keybind_overrides == {"a.one": "Ctrl+1"}
+
+
+def test_validating_getters_normalize_stored_values(app_settings):
+    app_settings._set_value("ui/theme_id", "  ")
+    app_settings._set_value("ui/album_artwork_selection_mode", " Double_Click ")
+
+    assert app_settings.theme_id == "musicorg-default"
+    assert app_settings.album_artwork_selection_mode == "double_click"
+
+    app_settings.theme_id = " nord-fjord "
+    app_settings.album_artwork_selection_mode = "bogus"
+
+    assert app_settings.theme_id == "nord-fjord"
+    assert app_settings.album_artwork_selection_mode == "single_click"
+
+
+def test_unchanged_values_are_not_written_back(app_settings, monkeypatch):
+    app_settings.theme_id = "nord-fjord"
+    writes: list[str] = []
+    monkeypatch.setattr(
+        app_settings,
+        "_qs",
+        _QSettingsProxy(app_settings._qs, app_settings._qs.value, lambda key, value: writes.append(key)),
+    )
+
+    app_settings.theme_id = " nord-fjord "
+    app_settings.source_dir = "/music/in"
+
+    assert writes == ["dirs/source"]
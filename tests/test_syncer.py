@@ -1,14 +1,17 @@
 """Tests for musicorg.core.syncer."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from musicorg.core import syncer
 from musicorg.core.syncer import (
     SyncItem, SyncManager, SyncPlan,
     _build_dest_path, _normalize_filename_for_match, _sanitize_filename,
-    _identity_tuple,
+    _identity_tuple, _path_exists_or_equivalent,
 )
+from musicorg.core.tag_cache import TagCache
 from musicorg.core.tagger import TagData
 
 
@@ -64,6 +67,14 @@ class TestBuildDestPath:
         assert ":" not in result.name
         # The forward slash in AC/DC is handled by path splitting
 
+    def test_tag_values_are_not_expanded_as_variables(self):
+        tags = {"albumartist": "$title", "album": "$year", "track": 2, "title": "Song"}
+        result = _build_dest_path(
+            Path("/dest"), tags, ".mp3",
+            "$albumartist/$album/$track $title ($year)"
+        )
+        assert result == Path("/dest/$title/$year/02 Song (0000).mp3")
+
     def test_disc_variable_substitution(self):
         tags = {"albumartist": "Artist", "album": "Album",
                 "disc": 1, "track": 1, "title": "Never Know"}
@@ -137,6 +148,8 @@ class TestSyncPlan:
         assert plan.to_copy == 2
         assert plan.already_exists == 1
         assert plan.errors == 1
+        assert plan.status_counts() == {"pending": 2, "exists": 1, "error": 1}
+        assert plan.status_counts()["copied"] == 0
 
 
 class TestSyncManager:
@@ -170,6 +183,24 @@ class TestSyncManager:
         assert dest_file.exists()
         assert result.items[0].status == "copied"
 
+    def test_execute_sync_shared_destination_copies_once(self, tmp_path):
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("first")
+        second.write_text("second")
+        dest_file = tmp_path / "out" / "song.txt"
+        plan = SyncPlan(items=[
+            SyncItem(source=first, dest=dest_file),
+            SyncItem(source=second, dest=dest_file),
+        ])
+        progress: list[int] = []
+
+        SyncManager().execute_sync(plan, progress_cb=lambda cur, _tot, _msg: progress.append(cur))
+
+        assert [item.status for item in plan.items] == ["copied", "exists"]
+        assert dest_file.read_text() == "first"
+        assert progress == [1, 2]
+
     def test_execute_sync_skips_exists(self, tmp_path):
         plan = SyncPlan(items=[
             SyncItem(source=Path("a"), dest=Path("b"), status="exists"),
@@ -218,6 +249,97 @@ class TestSyncManager:
         # song1 exists in both trees (same track identity), so no reverse copy for it.
         assert not any(i.source == dst_song1 for i in reverse_items)
 
+    def test_plan_sync_reuses_tag_cache_between_runs(self, tmp_path):
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        for name in ("a.mp3", "b.mp3", "c.mp3"):
+            (source / name).write_bytes(name.encode())
+
+        reads: list[Path] = []
+
+        def fake_read(path: Path) -> TagData:
+            reads.append(path)
+            return TagData(title=path.stem, artist="Artist", album="Album")
+
+        cache_db = str(tmp_path / "cache.db")
+        for _ in range(2):
+            mgr = SyncManager(cache_db_path=cache_db)
+            mgr._tag_manager.read = fake_read  # type: ignore[method-assign]
+            plan = mgr.plan_sync(source, dest)
+            assert [item.dest.stem for item in plan.items] == ["00 a", "00 b", "00 c"]
+
+        # The second plan is served entirely from the tag cache.
+        assert len(reads) == 3
+
+    def test_plan_sync_reads_in_batches_and_drops_artwork(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("musicorg.core.syncer._TAG_READ_BATCH", 2)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        for name in ("a.mp3", "b.mp3", "c.mp3", "d.mp3", "e.mp3"):
+            (source / name).write_bytes(name.encode())
+
+        flushed: list[int] = []
+        planned: list[dict] = []
+        real_put_many = TagCache.put_many
+        real_build = syncer._build_dest_path
+
+        def record_put_many(self, entries):
+            entries = list(entries)
+            flushed.append(len(entries))
+            real_put_many(self, entries)
+
+        def record_build(dest_dir, tags, *args):
+            planned.append(tags)
+            return real_build(dest_dir, tags, *args)
+
+        monkeypatch.setattr(TagCache, "put_many", record_put_many)
+        monkeypatch.setattr(syncer, "_build_dest_path", record_build)
+
+        mgr = SyncManager(cache_db_path=str(tmp_path / "cache.db"))
+        mgr._tag_manager.read = lambda path: TagData(  # type: ignore[method-assign]
+            title=path.stem, artwork_data=b"cover" * 1000, artwork_mime="image/jpeg",
+        )
+        plan = mgr.plan_sync(source, dest)
+
+        assert len(plan.items) == 5
+        # Fresh reads reach the cache one batch at a time.
+        assert flushed == [2, 2, 1]
+        assert all(tags["artwork_data"] is None for tags in planned)
+
+        cache = TagCache(tmp_path / "cache.db")
+        cache.open()
+        stored = cache.get(source / "a.mp3", (source / "a.mp3").stat().st_mtime_ns, 5)
+        cache.close()
+        assert stored is not None and stored.artwork_data == b"cover" * 1000
+
+    def test_existence_checks_list_each_directory_once(self, tmp_path, monkeypatch):
+        album_dir = tmp_path / "Artist" / "Album"
+        album_dir.mkdir(parents=True)
+        (album_dir / "01 - a.mp3").write_bytes(b"dst")
+        (album_dir / "b.mp3").write_bytes(b"dst")
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            listed.append(os.fspath(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        cache: dict[Path, set[tuple[str, str]]] = {}
+        results = [
+            _path_exists_or_equivalent(album_dir / name, cache)
+            for name in ("01 a.mp3", "b.mp3", "c.mp3")
+        ]
+
+        assert results == [True, True, False]
+        assert listed == [os.fspath(album_dir)]
+        assert not _path_exists_or_equivalent(tmp_path / "missing" / "a.mp3", cache)
+
     def test_plan_sync_marks_exists_when_equivalent_prefixed_name_exists(self, tmp_path):
         source = tmp_path / "source"
         dest = tmp_path / "dest"
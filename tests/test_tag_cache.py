@@ -1,6 +1,7 @@
 """Tests for musicorg.core.tag_cache."""
 
 from pathlib import Path
+import sqlite3
 
 from musicorg.core.tag_cache import TagCache
 from musicorg.core.tagger import TagData
@@ -89,3 +90,68 @@ def test_clear_removes_all_entries(tmp_path):
     cache.clear()
     assert cache.get(audio_path, 9, 9) is None
     cache.close()
+
+
+def test_relative_and_dotted_paths_share_an_entry(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "album").mkdir()
+    cache = TagCache(tmp_path / "tag_cache.db")
+    cache.open()
+    cache.put("album/../album/song.mp3", 1, 2, TagData(title="Song"))
+
+    hit = cache.get(tmp_path / "album" / "song.mp3", 1, 2)
+    cache.close()
+
+    assert hit is not None
+    assert hit.title == "Song"
+
+
+def test_open_drops_rows_keyed_by_resolved_paths_once(tmp_path):
+    db_path = tmp_path / "tag_cache.db"
+    cache = TagCache(db_path)
+    cache.open()
+    cache.put(tmp_path / "song.mp3", 1, 2, TagData(title="Song"))
+    cache.close()
+
+    cache.open()
+    assert cache.get(tmp_path / "song.mp3", 1, 2) is not None
+    cache.close()
+
+    # A database written before path keys switched to os.path.abspath.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("PRAGMA user_version = 0")
+    cache.open()
+    assert cache.get(tmp_path / "song.mp3", 1, 2) is None
+    cache.close()
+
+
+def test_get_many_returns_only_matching_fingerprints(tmp_path, monkeypatch):
+    monkeypatch.setattr("musicorg.core.tag_cache._MAX_QUERY_PARAMS", 2)
+    paths = [tmp_path / f"{name}.mp3" for name in "abcde"]
+    cache = TagCache(tmp_path / "tag_cache.db")
+    cache.open()
+    cache.put_many((path, 10, 20, TagData(title=path.stem)) for path in paths)
+
+    fingerprints = [(path, 10, 20) for path in paths[:4]]
+    fingerprints.append((paths[4], 11, 20))
+    fingerprints.append((tmp_path / "missing.mp3", 10, 20))
+    hits = cache.get_many(fingerprints)
+    cache.close()
+
+    assert {path: tags.title for path, tags in hits.items()} == {
+        path: path.stem for path in paths[:4]
+    }
+
+
+def test_get_many_can_leave_artwork_in_the_database(tmp_path):
+    path = tmp_path / "song.mp3"
+    cache = TagCache(tmp_path / "tag_cache.db")
+    cache.open()
+    cache.put(path, 10, 20, TagData(title="Song", artwork_data=b"img", artwork_mime="image/png"))
+
+    hit = cache.get_many([(path, 10, 20)], include_artwork=False)[path]
+    full = cache.get_many([(path, 10, 20)])[path]
+    cache.close()
+
+    assert (hit.title, hit.artwork_data, hit.artwork_mime) == ("Song", None, "")
+    assert (full.artwork_data, full.artwork_mime) == (b"img", "image/png")
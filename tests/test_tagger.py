@@ -1,10 +1,13 @@
 """Tests for musicorg.core.tagger."""
 
+from dataclasses import fields
 from pathlib import Path
+import threading
 
+import music_tag
 import pytest
 
-from musicorg.core.tagger import TagData, TagManager
+from musicorg.core.tagger import TagData, TagManager, _coerce_artwork_bytes
 from musicorg.errors import MusicOrgError, ErrorCode
 
 
@@ -38,6 +41,22 @@ class TestTagData:
         assert d["artwork_data"] == b"\x01\x02"
         assert d["artwork_mime"] == "image/png"
 
+    def test_as_dict_covers_every_field_without_instance_dict(self):
+        td = TagData()
+        assert not hasattr(td, "__dict__")
+        assert list(td.as_dict()) == [f.name for f in fields(TagData)]
+
+
+class TestCoerceArtworkBytes:
+    def test_bytes_are_returned_without_copying(self):
+        raw = b"\x89PNG" * 1024
+        assert _coerce_artwork_bytes(raw) is raw
+        assert _coerce_artwork_bytes(b"") is None
+
+    def test_other_buffers_and_callables_are_converted(self):
+        assert _coerce_artwork_bytes(memoryview(b"ab")) == b"ab"
+        assert _coerce_artwork_bytes(lambda: bytearray(b"cd")) == b"cd"
+
 
 class TestTagManager:
     @pytest.fixture
@@ -76,6 +95,47 @@ class TestTagManager:
         tags = tm.read(p)
         assert isinstance(tags, TagData)
 
+    def test_read_mp3_fast_path_matches_music_tag(self, sample_mp3, monkeypatch):
+        f = music_tag.load_file(str(sample_mp3))
+        f["tracktitle"] = "Song"
+        f["artist"] = "Band"
+        f["albumartist"] = "Various"
+        f["tracknumber"] = 3
+        f["discnumber"] = 2
+        f["year"] = 1999
+        f["comment"] = "A comment"
+        f["lyrics"] = "Some lyrics"
+        f.save()
+
+        fast = TagManager().read(sample_mp3, include_artwork=False)
+        monkeypatch.setattr("musicorg.core.tagger._FAST_READERS", {})
+        slow = TagManager().read(sample_mp3, include_artwork=False)
+
+        assert fast == slow
+        assert fast.title == "Song"
+        assert (fast.track, fast.disc, fast.year) == (3, 2, 1999)
+
+    def test_write_known_extension_skips_format_sniffing(self, sample_mp3, monkeypatch):
+        def _sniff(_path):
+            raise AssertionError("load_file should not be needed for .mp3")
+
+        monkeypatch.setattr("musicorg.core.tagger.music_tag.load_file", _sniff)
+
+        TagManager().write(sample_mp3, TagData(title="Song", track=4))
+
+        tags = TagManager().read(sample_mp3, include_artwork=False)
+        assert (tags.title, tags.track) == ("Song", 4)
+
+    def test_read_many_preserves_input_order(self, monkeypatch):
+        tm = TagManager()
+        monkeypatch.setattr(tm, "read", lambda path: TagData(title=Path(path).stem))
+        paths = [f"{index}.mp3" for index in range(20)]
+
+        results = tm.read_many(paths, max_workers=4)
+
+        assert [tags.title for tags in results] == [str(index) for index in range(20)]
+        assert tm.read_many([]) == []
+
     def test_write_invalid_file_raises_musicorg_error(self, tmp_path):
         """Writing to a file that cannot be loaded raises MusicOrgError."""
         p = tmp_path / "test.xyz"
@@ -111,6 +171,28 @@ class TestTagManager:
         assert tags.artwork_data == b"\x89PNGdata"
         assert tags.artwork_mime == "image/png"
 
+    def test_read_can_skip_artwork(self, monkeypatch):
+        requested: list[str] = []
+
+        class _Field:
+            def __init__(self, first):
+                self.first = first
+
+        class _File:
+            def __getitem__(self, key):
+                requested.append(key)
+                return _Field("Song" if key == "tracktitle" else None)
+
+        monkeypatch.setattr(
+            "musicorg.core.tagger.music_tag.load_file",
+            lambda _path: _File(),
+        )
+
+        tags = TagManager().read("dummy.mp3", include_artwork=False)
+        assert tags.title == "Song"
+        assert tags.artwork_data is None
+        assert "artwork" not in requested
+
     def test_write_artwork_uses_fmt_constructor_when_available(self, monkeypatch):
         calls = []
 
@@ -141,6 +223,68 @@ class TestTagManager:
         assert artwork_calls
         assert artwork_calls[0][1].get("fmt") == "png"
 
+    def test_write_reuses_prepared_artwork_for_the_same_image(self, monkeypatch):
+        built = []
+        embedded = []
+
+        class _File:
+            def __setitem__(self, key, value):
+                if key == "artwork":
+                    embedded.append(value)
+
+            def save(self):
+                pass
+
+        class _Artwork:
+            def __init__(self, **kwargs):
+                built.append(kwargs)
+
+        monkeypatch.setattr(
+            "musicorg.core.tagger.music_tag.load_file",
+            lambda _path: _File(),
+        )
+        monkeypatch.setattr("musicorg.core.tagger.music_tag.Artwork", _Artwork)
+
+        tm = TagManager()
+        artwork = b"\x89PNGcover"
+        for name in ("01.mp3", "02.mp3", "03.mp3"):
+            tm.write(name, TagData(artwork_data=artwork, artwork_mime="image/png"))
+        tm.write("04.mp3", TagData(artwork_data=b"\xFF\xD8\xFFother", artwork_mime="image/jpeg"))
+
+        assert len(built) == 2
+        assert embedded[0] is embedded[1] is embedded[2]
+        assert embedded[3] is not embedded[0]
+
+    def test_concurrent_writes_do_not_share_prepared_artwork(self, monkeypatch):
+        embedded: dict[str, object] = {}
+
+        class _File:
+            def __init__(self, path):
+                self.path = path
+
+            def __setitem__(self, key, value):
+                if key == "artwork":
+                    embedded[self.path] = value
+
+            def save(self):
+                pass
+
+        monkeypatch.setattr("musicorg.core.tagger.music_tag.load_file", _File)
+        monkeypatch.setattr("musicorg.core.tagger.music_tag.Artwork", lambda **kwargs: object())
+
+        tm = TagManager()
+        tags = TagData(artwork_data=b"\x89PNGcover", artwork_mime="image/png")
+        threads = [
+            threading.Thread(target=tm.write, args=(name, tags))
+            for name in ("01.mp3", "02.mp3")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert embedded["01.mp3"] is not embedded["02.mp3"]
+
     def test_write_artwork_failure_raises_value_error(self, monkeypatch):
         class _File:
             def __setitem__(self, key, value):
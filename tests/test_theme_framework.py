@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -10,7 +11,9 @@ import pytest
 from musicorg.ui.themes.constants import REQUIRED_TOKEN_KEYS
 from musicorg.ui.themes.loader import load_theme_package
 from musicorg.ui.themes.models import ThemeValidationError
+from musicorg.ui.themes import registry as registry_module
 from musicorg.ui.themes.registry import ThemeRegistry
+from musicorg.ui.themes.service import ThemeService
 
 
 def _write_json(path: Path, data: dict[str, object]) -> None:
@@ -42,6 +45,12 @@ def _write_theme_dir(theme_dir: Path, theme_id: str, accent: str = "#22aa66") ->
     _write_json(theme_dir / "tokens.json", tokens)
 
 
+def _settle_mtimes(theme_dir: Path) -> None:
+    # Files written moments ago are too fresh for the registry to cache.
+    for path in theme_dir.iterdir():
+        os.utime(path, (1_600_000_000, 1_600_000_000))
+
+
 def test_load_theme_package_valid(tmp_path: Path) -> None:
     theme_dir = tmp_path / "test-theme"
     _write_theme_dir(theme_dir, "test-theme")
@@ -136,3 +145,109 @@ def test_load_theme_rejects_manifest_field_length_and_newlines(tmp_path: Path) -
     _write_json(theme_dir / "manifest.json", manifest)
     with pytest.raises(ThemeValidationError):
         load_theme_package(theme_dir)
+
+
+def test_registry_cache_reuses_unchanged_themes(tmp_path: Path, monkeypatch) -> None:
+    builtin_root = tmp_path / "builtin"
+    user_root = tmp_path / "user"
+    cache_path = tmp_path / "theme_cache.json"
+    _write_theme_dir(builtin_root / "cached-theme", "cached-theme", accent="#00ff00")
+    _settle_mtimes(builtin_root / "cached-theme")
+
+    ThemeRegistry(builtin_root, user_root, cache_path=cache_path).reload()
+    assert cache_path.exists()
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("theme should come from the cache")
+
+    monkeypatch.setattr(registry_module, "load_theme_package", fail_load)
+    registry = ThemeRegistry(builtin_root, user_root, cache_path=cache_path)
+    registry.reload()
+
+    package = registry.get_theme("cached-theme")
+    assert package is not None
+    assert package.tokens["accent"] == "#00ff00"
+    assert package.source_dir == builtin_root / "cached-theme"
+    assert package.is_builtin is True
+
+
+def test_registry_cache_reparses_changed_themes(tmp_path: Path) -> None:
+    builtin_root = tmp_path / "builtin"
+    user_root = tmp_path / "user"
+    cache_path = tmp_path / "theme_cache.json"
+    theme_dir = user_root / "changing-theme"
+    _write_theme_dir(theme_dir, "changing-theme", accent="#00ff00")
+    ThemeRegistry(builtin_root, user_root, cache_path=cache_path).reload()
+
+    tokens = _base_tokens()
+    tokens["accent"] = "#00f"
+    _write_json(theme_dir / "tokens.json", tokens)
+    registry = ThemeRegistry(builtin_root, user_root, cache_path=cache_path)
+    registry.reload()
+
+    package = registry.get_theme("changing-theme")
+    assert package is not None
+    assert package.tokens["accent"] == "#00f"
+
+
+def test_registry_cache_does_not_store_freshly_modified_themes(tmp_path: Path) -> None:
+    cache_path = tmp_path / "theme_cache.json"
+    _write_theme_dir(tmp_path / "user" / "fresh-theme", "fresh-theme")
+
+    ThemeRegistry(tmp_path / "builtin", tmp_path / "user", cache_path=cache_path).reload()
+
+    assert not cache_path.exists()
+
+
+def test_registry_cache_revalidates_cached_overrides(tmp_path: Path) -> None:
+    builtin_root = tmp_path / "builtin"
+    user_root = tmp_path / "user"
+    cache_path = tmp_path / "theme_cache.json"
+    theme_dir = user_root / "cached-theme"
+    _write_theme_dir(theme_dir, "cached-theme")
+    _settle_mtimes(theme_dir)
+    ThemeRegistry(builtin_root, user_root, cache_path=cache_path).reload()
+
+    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    for entry in data["themes"].values():
+        entry["package"]["overrides_qss"] = '@import url("http://example.com/x.qss");'
+    cache_path.write_text(json.dumps(data), encoding="utf-8")
+    registry = ThemeRegistry(builtin_root, user_root, cache_path=cache_path)
+    registry.reload()
+
+    package = registry.get_theme("cached-theme")
+    assert package is not None
+    assert package.overrides_qss == ""
+
+
+class _FakeApp:
+    def __init__(self) -> None:
+        self.stylesheet = ""
+        self.set_calls = 0
+
+    def styleSheet(self) -> str:
+        return self.stylesheet
+
+    def setStyleSheet(self, stylesheet: str) -> None:
+        self.stylesheet = stylesheet
+        self.set_calls += 1
+
+
+class _FakeSettings:
+    theme_id = ""
+    theme_last_known_good_id = ""
+
+
+def test_service_skips_reapplying_identical_stylesheet(tmp_path: Path) -> None:
+    builtin_root = tmp_path / "builtin"
+    _write_theme_dir(builtin_root / "same-theme", "same-theme")
+    registry = ThemeRegistry(builtin_root=builtin_root, user_root=tmp_path / "user")
+    registry.reload()
+    app = _FakeApp()
+    service = ThemeService(app, _FakeSettings(), registry)
+
+    assert service.apply_theme("same-theme")[0] is True
+    assert service.apply_theme("same-theme")[0] is True
+
+    assert app.set_calls == 1
+    assert service.active_theme_id == "same-theme"